@@ -0,0 +1,84 @@
+"""Calendar dimension table for data warehouse.
+
+>>> from borax.calendars.dimension import iter_dimension_rows
+>>> from borax.calendars.festivals2 import FestivalLibrary
+>>> rows = iter_dimension_rows(date(2024, 2, 10), date(2024, 2, 10), library=FestivalLibrary.load_builtin())
+>>> next(rows)
+(datetime.date(2024, 2, 10), 2024, 1, 1, 0, '甲辰', '丙寅', '甲辰', None, '龙', 5, ('春节',))
+"""
+import collections
+import csv
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .lunardate import (
+    LunarDate, MAX_OFFSET, MIN_SOLAR_DATE, TextUtils, _iter_offset_ymdl, _gz_ymd_term, _solar_offset
+)
+
+__all__ = ['DIMENSION_FIELDS', 'iter_dimension_rows', 'dimension_columns', 'dimension_to_csv']
+
+DIMENSION_FIELDS = (
+    'solar', 'lunar_year', 'lunar_month', 'lunar_day', 'leap',
+    'gz_year', 'gz_month', 'gz_day', 'term', 'animal', 'weekday', 'festivals'
+)
+
+_MIN_ORDINAL = MIN_SOLAR_DATE.toordinal()
+
+
+def _offset_range(start_date, end_date) -> Tuple[int, int]:
+    start_offset = 0 if start_date is None else _solar_offset(start_date)
+    end_offset = MAX_OFFSET if end_date is None else _solar_offset(end_date)
+    return start_offset, end_offset
+
+
+def _collect_festival_names(library, start_offset: int, end_offset: int) -> Dict[int, List[str]]:
+    """Resolve every festival once for the whole range, return offset -> names in library order."""
+    names = collections.defaultdict(list)
+    if not library:
+        return names
+    start_date, end_date = LunarDate._from_offset(start_offset), LunarDate._from_offset(end_offset)
+    for festival in library:
+        for wd in festival.iter_days(start_date, end_date):
+            names[wd.solar.toordinal() - _MIN_ORDINAL].append(festival.name)
+    return names
+
+
+def iter_dimension_rows(start_date=None, end_date=None, library=None) -> Iterator[tuple]:
+    """Yield one row per day in range [start_date, end_date], whose fields are DIMENSION_FIELDS.
+
+    :param start_date: a date/LunarDate/WrappedDate object, default LunarDate.min (1900-01-31)
+    :param end_date: a date/LunarDate/WrappedDate object, default LunarDate.max (2101-01-28)
+    :param library: a FestivalLibrary object for the festivals column, which is always empty if it is None
+    """
+    start_offset, end_offset = _offset_range(start_date, end_date)
+    festival_names = _collect_festival_names(library, start_offset, end_offset)
+    for offset, (year, month, day, leap) in _iter_offset_ymdl(start_offset, end_offset):
+        solar = date.fromordinal(_MIN_ORDINAL + offset)
+        gz_year, gz_month, gz_day, term = _gz_ymd_term(offset, year, solar)
+        yield (
+            solar, year, month, day, leap,
+            gz_year, gz_month, gz_day, term, TextUtils.ANIMALS[(year - 4) % 12], (offset + 2) % 7,
+            tuple(festival_names.get(offset, ()))
+        )
+
+
+def dimension_columns(start_date=None, end_date=None, library=None) -> Dict[str, list]:
+    """Return the dimension table as a dict of field name -> column list."""
+    columns = {field: [] for field in DIMENSION_FIELDS}
+    appends = [columns[field].append for field in DIMENSION_FIELDS]
+    for row in iter_dimension_rows(start_date, end_date, library):
+        for append, value in zip(appends, row):
+            append(value)
+    return columns
+
+
+def dimension_to_csv(path_or_buf, start_date=None, end_date=None, library=None, festival_sep: str = ';'):
+    """Save the dimension table to a csv file with a header row.The festival names are joined by festival_sep."""
+    if isinstance(path_or_buf, (str, Path)):
+        with open(path_or_buf, 'w', encoding='utf8', newline='') as f:
+            return dimension_to_csv(f, start_date, end_date, library, festival_sep)
+    writer = csv.writer(path_or_buf)
+    writer.writerow(DIMENSION_FIELDS)
+    for row in iter_dimension_rows(start_date, end_date, library):
+        writer.writerow(row[:-1] + (festival_sep.join(row[-1]),))
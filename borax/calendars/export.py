@@ -0,0 +1,133 @@
+"""Export calendars with festival annotations for a range of solar years.
+
+The years are split into shards and rendered in a process pool, the festival library is sent to
+the worker processes as its encoded rows (code, name, catalog) instead of pickled objects.
+
+Example (it writes calendar.csv in the current directory):
+
+    from borax.calendars.export import export_calendar_csv
+    from borax.calendars.festivals2 import FestivalLibrary
+
+    export_calendar_csv('calendar.csv', 1900, 2100, library=FestivalLibrary.load_builtin())
+"""
+import calendar
+import collections
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from .festivals2 import FestivalLibrary, decode_festival
+from .lunardate import MIN_SOLAR_DATE, MAX_SOLAR_DATE
+
+__all__ = ['EXPORT_FIELDS', 'iter_calendar_rows', 'export_calendar_csv']
+
+EXPORT_FIELDS = ('solar', 'lunar', 'text', 'festivals')
+
+FestivalRow = Tuple[str, str, str]
+
+
+def _encode_library(library: Optional[FestivalLibrary]) -> List[FestivalRow]:
+    """Return the rows as FestivalLibrary.to_csv writes."""
+    if not library:
+        return []
+    return [(festival.code, festival.name, festival.catalog) for festival in library]
+
+
+def _decode_library(festival_rows: Sequence[FestivalRow]) -> FestivalLibrary:
+    library = FestivalLibrary()
+    for code, name, catalog in festival_rows:
+        festival = decode_festival(code)
+        festival.set_name(name)
+        festival.catalog = catalog
+        library.append(festival)
+    return library
+
+
+def _month_range(year: int, month: int) -> Tuple[date, date]:
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _iter_months(start_year: int, end_year: int) -> Iterator[Tuple[int, int]]:
+    """Yield the (year, month) whose days are all in the supported range."""
+    for year in range(start_year, end_year + 1):
+        for month in range(1, 13):
+            first_day, last_day = _month_range(year, month)
+            if MIN_SOLAR_DATE <= first_day and last_day <= MAX_SOLAR_DATE:
+                yield year, month
+
+
+def _export_years(festival_rows: Sequence[FestivalRow], start_year: int, end_year: int) -> List[tuple]:
+    """Render the rows of a year shard, it runs in a worker process."""
+    library = _decode_library(festival_rows)
+    months = list(_iter_months(start_year, end_year))
+    if not months:
+        return []
+    library.build_index(_month_range(*months[0])[0], _month_range(*months[-1])[1])
+    rows = []
+    for year, month in months:
+        for week in library.monthdaycalendar(year, month):
+            for day, text, wd in week:
+                if day == 0:
+                    continue
+                rows.append((wd.solar, wd.lunar.cn_str(), text, tuple(library.get_festival_names(wd.solar))))
+    return rows
+
+
+def _split_years(start_year: int, end_year: int, nshards: int) -> List[Tuple[int, int]]:
+    nyears = end_year - start_year + 1
+    size = max(1, -(-nyears // nshards))
+    return [(year, min(year + size - 1, end_year)) for year in range(start_year, end_year + 1, size)]
+
+
+def iter_calendar_rows(start_year: int, end_year: int, library: FestivalLibrary = None,
+                       max_workers: Optional[int] = None) -> Iterator[tuple]:
+    """Yield one row per day of solar years [start_year, end_year] in date order, whose fields are EXPORT_FIELDS.
+    The months partly out of range [1900-01-31, 2101-01-28] are skipped.
+
+    :param start_year: the first solar year
+    :param end_year: the last solar year
+    :param library: a FestivalLibrary object for the festival annotations
+    :param max_workers: the number of worker processes, default os.cpu_count(). Run in current process if it is 1.
+
+    The year shards are submitted to the process pool lazily. If the consumer stops early, the pending shards are
+    cancelled and only the running ones are waited for.
+    """
+    festival_rows = _encode_library(library)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        yield from _export_years(festival_rows, start_year, end_year)
+        return
+    # More shards than workers keep all processes busy when some years are slower than others.
+    shards = iter(_split_years(start_year, end_year, max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Submit shards lazily and keep at most 2 * max_workers of them pending,
+        # so a consumer stopping early does not wait for all the remaining shards.
+        pending = collections.deque(
+            executor.submit(_export_years, festival_rows, *shard) for shard in islice(shards, max_workers * 2)
+        )
+        try:
+            while pending:
+                rows = pending.popleft().result()
+                shard = next(shards, None)
+                if shard is not None:
+                    pending.append(executor.submit(_export_years, festival_rows, *shard))
+                yield from rows
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def export_calendar_csv(path_or_buf, start_year: int, end_year: int, library: FestivalLibrary = None,
+                        max_workers: Optional[int] = None, festival_sep: str = ';'):
+    """Save the calendar rows to a csv file with a header row.The festival names are joined by festival_sep."""
+    if isinstance(path_or_buf, (str, Path)):
+        with open(path_or_buf, 'w', encoding='utf8', newline='') as f:
+            return export_calendar_csv(f, start_year, end_year, library, max_workers, festival_sep)
+    writer = csv.writer(path_or_buf)
+    writer.writerow(EXPORT_FIELDS)
+    for row in iter_calendar_rows(start_year, end_year, library, max_workers):
+        writer.writerow(row[:-1] + (festival_sep.join(row[-1]),))
@@ -2,16 +2,25 @@
 
 import calendar
 import collections
+import copy
 import csv
 import enum
+import heapq
+import itertools
+import marshal
+import sys
+import threading
 import warnings
 from datetime import date, timedelta, datetime
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional, Union, Iterator, Set, Generator, Sequence, Literal
 
 from borax.calendars.dataset import get_festival_dataset_path
-from borax.calendars.lunardate import LunarDate, LCalendars, TermUtils, TextUtils, TERMS_CN
+from borax.calendars.lunardate import (
+    LunarDate, LCalendars, InvalidLunarDateError, TermUtils, TextUtils, TERMS_CN, MIN_SOLAR_DATE, MAX_SOLAR_DATE,
+    MAX_OFFSET, _iter_offset_ymdl, _solar_offset
+)
 
 __all__ = [
     'FestivalError', 'WrappedDate', 'Period',
@@ -23,6 +32,9 @@ __all__ = [
 
 MixedDate = Union[date, LunarDate]
 
+_MIN_SOLAR_ORDINAL = MIN_SOLAR_DATE.toordinal()
+_MAX_SOLAR_ORDINAL = MAX_SOLAR_DATE.toordinal()
+
 
 # Public Constants
 
@@ -66,24 +78,38 @@ class FestivalSchema(enum.IntEnum):
 
 
 class WrappedDate:
-    """A date object with solar and lunar calendars."""
+    """A date object with solar and lunar calendars.
+
+    Only the source date is stored on creation, the other one is converted when it is first accessed.
+    """
     __slots__ = ['_solar', '_lunar', 'name', '_fl']
 
     def __init__(self, date_obj: MixedDate, name: str = ''):
-        self._solar = LCalendars.cast_date(date_obj, date)
-        self._lunar = LCalendars.cast_date(date_obj, LunarDate)
-        self.name = name
-        if isinstance(date_obj, date):
-            self._fl = 's'
+        if isinstance(date_obj, WrappedDate):
+            self._solar, self._lunar, self._fl = date_obj._solar, date_obj._lunar, date_obj._fl
+        elif isinstance(date_obj, date):
+            # Check the range here, so an out-of-range date fails at creation instead of the first .lunar access.
+            if not _MIN_SOLAR_ORDINAL <= date_obj.toordinal() <= _MAX_SOLAR_ORDINAL:
+                raise InvalidLunarDateError(f'[solar={date_obj}]: Out of range.')
+            self._solar, self._lunar, self._fl = date_obj, None, 's'
+        elif isinstance(date_obj, LunarDate):
+            self._solar, self._lunar, self._fl = None, date_obj, 'l'
         else:
+            self._solar = LCalendars.cast_date(date_obj, date)
+            self._lunar = date_obj.lunar
             self._fl = 'l'
+        self.name = name
 
     @property
-    def solar(self):
+    def solar(self) -> date:
+        if self._solar is None:
+            self._solar = self._lunar.to_solar_date()
         return self._solar
 
     @property
-    def lunar(self):
+    def lunar(self) -> LunarDate:
+        if self._lunar is None:
+            self._lunar = LunarDate.from_solar(self._solar)
         return self._lunar
 
     def __iter__(self):
@@ -210,6 +236,10 @@ class Festival:
     """A abstract class presenting a festival."""
     date_class = None
 
+    _resolve_cache = None  # An OrderedDict of (code, leap, year, month, leap) -> dates when the LRU cache is enabled.
+    _resolve_cache_size = 0
+    _resolve_cache_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         self._schema = kwargs.get('schema', -1)
         self._name = kwargs.get('name', '')
@@ -296,6 +326,11 @@ class Festival:
     def __eq__(self, other):
         return isinstance(self, type(other)) and other.name == self.name
 
+    def __copy__(self):
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        return obj
+
     def is_(self, date_obj: MixedDate) -> bool:
         date_obj = self._normalize(date_obj)
         try:
@@ -315,7 +350,53 @@ class Festival:
             raise FestivalError('MultipleDateExist', 'The result return {} dates.'.format(len(date_list)))
         return date_list[0]
 
+    @staticmethod
+    def enable_cache(maxsize: int = 1024):
+        """Cache the resolved dates of all festivals in a LRU dict, keyed by the festival code and (year, month, leap).
+
+        At most maxsize results are kept and the least recently used ones are dropped first.
+        A maxsize of 0 disables and clears the cache.
+        """
+        with Festival._resolve_cache_lock:
+            if maxsize > 0:
+                if Festival._resolve_cache is None:
+                    Festival._resolve_cache = collections.OrderedDict()
+                Festival._resolve_cache_size = maxsize
+                while len(Festival._resolve_cache) > maxsize:
+                    Festival._resolve_cache.popitem(last=False)
+            else:
+                Festival._resolve_cache = None
+                Festival._resolve_cache_size = 0
+
+    @staticmethod
+    def clear_cache():
+        """Clear the cached dates and keep the cache enabled."""
+        with Festival._resolve_cache_lock:
+            if Festival._resolve_cache is not None:
+                Festival._resolve_cache.clear()
+
     def _resolve(self, year: int, month: int = 0, leap=_IGNORE_LEAP_MONTH) -> List[Union[date, LunarDate]]:
+        cache = Festival._resolve_cache
+        if cache is None:
+            return self._resolve_dates(year, month, leap)
+        try:
+            # The code does not tell leap=0 from the default _IGNORE_LEAP_MONTH for LunarFestival.
+            key = (self.code, self._leap, year, month, leap)
+        except NotImplementedError:
+            return self._resolve_dates(year, month, leap)
+        with Festival._resolve_cache_lock:
+            date_list = cache.get(key)
+            if date_list is not None:
+                cache.move_to_end(key)
+        if date_list is None:
+            date_list = tuple(self._resolve_dates(year, month, leap))
+            with Festival._resolve_cache_lock:
+                cache[key] = date_list
+                while len(cache) > Festival._resolve_cache_size:
+                    cache.popitem(last=False)
+        return list(date_list)
+
+    def _resolve_dates(self, year: int, month: int = 0, leap=_IGNORE_LEAP_MONTH) -> List[Union[date, LunarDate]]:
         _y = year
         if month != 0 and self._month != 0 and month != self._month:
             raise FestivalError('DateDoesNotExist', 'Date does not exist.')
@@ -366,14 +447,10 @@ class Festival:
 
             Festival.list_days(*Period.solar_year(2021))
         """
-        days_list = []
-        ncount = 0
-        for day in self.iter_days(start_date=start_date, end_date=end_date, reverse=reverse):
-            if ncount == count:
-                break
-            days_list.append(day)
-            ncount += 1
-        return days_list
+        days = self.iter_days(start_date=start_date, end_date=end_date, reverse=reverse)
+        if count >= 0:
+            days = itertools.islice(days, count)
+        return list(days)
 
     def list_days_in_future(self, end_date=None, reverse: bool = False, count: int = -1) -> List[WrappedDate]:
         """Return the day list for this festival in future days."""
@@ -393,9 +470,8 @@ class Festival:
         """Return the offset-date tuple of the first day for this festival in future days."""
         if date_obj is None:
             date_obj = date.today()
-        days = list(self.list_days(start_date=date_obj))
-        if days:
-            this_day = days[0]
+        this_day = next(self.iter_days(start_date=date_obj), None)  # Only resolve until the first day.
+        if this_day is not None:
             return LCalendars.delta(this_day, date_obj), this_day
         return -1, None
 
@@ -409,6 +485,8 @@ class Festival:
         for year in my_iter:
             try:
                 obj_list = self._resolve(year)
+                if reverse:
+                    obj_list = obj_list[::-1]
                 for day in obj_list:
                     yield day
             except FestivalError:
@@ -421,6 +499,8 @@ class Festival:
         for year, month in self._iter_solar_month(sy, sm, ey, em, reverse):
             try:
                 obj_list = self._resolve(year, month)
+                if reverse:
+                    obj_list = obj_list[::-1]
                 for day in obj_list:
                     yield day
             except FestivalError:
@@ -458,7 +538,28 @@ class Festival:
         raise NotImplementedError('You should implement this method by extend this class.')
 
 
-class SolarFestival(Festival):
+class _SolarListMixin:
+    """A fast path of Festival._list_yearly / Festival._list_monthly for the festivals with solar dates,
+    whose _resolve_yearly / _resolve_monthly return the exact dates of the year/month without raising FestivalError.
+    The dates are read through Festival._resolve when the cache is enabled.
+    """
+
+    def _list_yearly(self, start_date, end_date, reverse):
+        cached = Festival._resolve_cache is not None
+        years = range(start_date.year, end_date.year + 1)
+        for year in (reversed(years) if reverse else years):
+            yield from (self._resolve(year) if cached else self._resolve_yearly(year))
+
+    def _list_monthly(self, start_date, end_date, reverse):
+        cached = Festival._resolve_cache is not None
+        for year, month in self._iter_solar_month(start_date.year, start_date.month, end_date.year, end_date.month,
+                                                  reverse):
+            if self._month != 0 and month != self._month:  # Same as the month check in Festival._resolve
+                continue
+            yield from (self._resolve(year, month) if cached else self._resolve_monthly(year, month))
+
+
+class SolarFestival(_SolarListMixin, Festival):
     """A festival with solar.
 
     >>> SolarFestival(month=1, day=1, name='元旦')
@@ -499,47 +600,32 @@ class SolarFestival(Festival):
                 cn_list.append(f'{self._day}日')
         return ''.join(cn_list)
 
+    def _day_of_month(self, year: int, month: int) -> int:
+        """Return the day in the solar month, or 0 if it does not exist."""
+        ndays = calendar.monthrange(year, month)[1]
+        day = ndays - self._day + 1 if self._reverse else self._day
+        return day if 0 < day <= ndays else 0
+
     def _resolve_yearly(self, year) -> List[Union[date, LunarDate]]:
         if self._month == 0:
-            if self._reverse == 0:
-                _index = self._day
-            else:
-                _index = 366 + int(calendar.isleap(year)) - self._day
-            for month in range(1, 13):
-                ndays = calendar.monthrange(year, month)[1]
-                if _index <= ndays:
-                    return [date(year, month, _index)]
-                else:
-                    _index -= ndays
-            return []
-        else:
-            nday_this_month = calendar.monthrange(year, self._month)[1]
-            if self._reverse == 0:
-                day = self._day
-                if 0 < self._day <= nday_this_month:
-                    return [date(year, self._month, day)]
-            else:
-                day = nday_this_month - self._day + 1
-                return [date(year, self._month, day)]
+            ndays = 365 + int(calendar.isleap(year))
+            index = ndays - self._day + 1 if self._reverse else self._day
+            if 0 < index <= ndays:
+                return [date(year, 1, 1) + timedelta(days=index - 1)]
             return []
+        day = self._day_of_month(year, self._month)
+        if day:
+            return [date(year, self._month, day)]
+        return []
 
     def _resolve_monthly(self, year, month, leap=0) -> List[Union[date, LunarDate]]:
-
-        if month == 0:
-            data = []
-            for m in range(1, 13):
-                if self._reverse == 0:
-                    day = self._day
-                else:
-                    day = calendar.monthrange(year, m)[1] - self._day + 1
+        months = range(1, 13) if month == 0 else (month,)
+        data = []
+        for m in months:
+            day = self._day_of_month(year, m)
+            if day:
                 data.append(date(year, m, day))
-            return data
-        else:
-            if self._reverse == 0:
-                day = self._day
-            else:
-                day = calendar.monthrange(year, month)[1] - self._day + 1
-            return [date(year, month, day)]
+        return data
 
     def encode(self) -> str:
         flag = 0
@@ -555,7 +641,7 @@ class SolarFestival(Festival):
             return '0{:04d}{:X}'.format(self._day, flag)
 
 
-class WeekFestival(Festival):
+class WeekFestival(_SolarListMixin, Festival):
     """A festival with week info.
 
     >>> WeekFestival(month=5, index=2, week=calendar.SUNDAY, name='母亲节')
@@ -583,37 +669,40 @@ class WeekFestival(Festival):
 
     def _resolve_yearly(self, year) -> List[Union[date, LunarDate]]:
         s_i = -self._week_index if self._reverse == 1 else self._week_index
-        day = WeekFestival.week_day(year, self._month, s_i, self._week_no)
-        return [date(year, self._month, day)]
+        day = WeekFestival._week_day(year, self._month, s_i, self._week_no)
+        if day:
+            return [date(year, self._month, day)]
+        return []
 
     def _resolve_monthly(self, year, month, leap=0) -> List[Union[date, LunarDate]]:
         assert self._month == 0
         s_i = -self._week_index if self._reverse == 1 else self._week_index
+        months = range(1, 13) if month == 0 else (month,)
         day_list = []
-        for m_month in range(1, 13):
-            try:
-                day_no = WeekFestival.week_day(year, m_month, s_i, self._week_no)
+        for m_month in months:
+            day_no = WeekFestival._week_day(year, m_month, s_i, self._week_no)
+            if day_no:
                 day_list.append(date(year, m_month, day_no))
-            except FestivalError:
-                pass
         return day_list
 
     @staticmethod
-    def week_day(year: int, month: int, index: int, week: int) -> int:
+    def _week_day(year: int, month: int, index: int, week: int) -> int:
+        """Return the day of the index-th week in the solar month, or 0 if it does not exist."""
         w, ndays = calendar.monthrange(year, month)
-        if week >= w:
-            d0 = week - w + 1
-        else:
-            d0 = 8 - (w - week)
-
-        ds = list(range(d0, ndays + 1, 7))
-        ll = len(ds)
-        if -ll <= index < 0:
-            return ds[index]
-        elif 0 < index <= ll:
-            return ds[index - 1]
-        else:
+        d0 = (week - w) % 7 + 1
+        count = (ndays - d0) // 7 + 1
+        if 0 < index <= count:
+            return d0 + 7 * (index - 1)
+        elif -count <= index < 0:
+            return d0 + 7 * (count + index)
+        return 0
+
+    @staticmethod
+    def week_day(year: int, month: int, index: int, week: int) -> int:
+        day = WeekFestival._week_day(year, month, index, week)
+        if day == 0:
             raise FestivalError('InvalidIndex', f'Invalid index: {index}')
+        return day
 
     def encode(self) -> str:
         return '2{:02d}{}{}{}'.format(self._month, self._reverse, self._week_index, self._week_no)
@@ -738,11 +827,14 @@ class LunarFestival(Festival):
             else:
                 ndays_of_year = sum([t[1] for t in month_meta])
                 _index = ndays_of_year - self._day + 1  # check ValueError
+            if _index <= 0:
+                return []
             for _m, _nd, _l in month_meta:
                 if _index <= _nd:
                     return [LunarDate(year, _m, _index, _l)]
                 else:
                     _index -= _nd
+            return []
         else:
             return self._build_date(year, self._month, self._day, self._leap, self._reverse)
 
@@ -781,6 +873,8 @@ class LunarFestival(Festival):
         for year, month, leap in self._iter_lunar_month(sy, sm, sl, ey, em, el, reverse):
             try:
                 obj_list = self._resolve(year, month, leap)
+                if reverse:
+                    obj_list = obj_list[::-1]
                 for day in obj_list:
                     yield day
             except FestivalError:
@@ -827,6 +921,13 @@ __SCHEMA_CLASS_DICT = {
 }
 
 
+@lru_cache(maxsize=None)
+def _compiled_festival_attrs() -> dict:
+    """Return schema -> (festival class, attribute names) for FestivalLibrary.load_compiled."""
+    samples = [SolarFestival(day=1), LunarFestival(day=1), WeekFestival(month=1, index=1, week=0), TermFestival(0)]
+    return {festival.schema: (type(festival), set(festival.__dict__)) for festival in samples}
+
+
 def encode(obj: Union[WrappedDate, Festival]) -> str:
     return obj.encode()
 
@@ -1004,6 +1105,201 @@ class FestivalLibrary(collections.UserList):
     [<WrappedDate:2022-01-01(冬月廿九)>]
     """
 
+    _load_cache = {}  # (path, unique) -> ((mtime_ns, size), festivals) of load_file
+
+    # The number of month calendars cached by iter_month_daytuples / monthdaycalendar.
+    MONTH_CACHE_SIZE = 24
+
+    # The header of compiled files, increase COMPILED_VERSION when the attributes of Festival classes are changed.
+    COMPILED_MAGIC = b'BXFL'
+    COMPILED_VERSION = 1
+
+    def __init__(self, initlist=None):
+        super().__init__(initlist)
+        # Derived structures, which are rebuilt lazily after the library is reordered
+        # and updated incrementally when festivals are appended or removed.
+        self._code_index = None  # code -> [festival, ...] in library order
+        self._name_index = None  # name -> [festival, ...] in library order
+        self._index_range = None  # (start_offset, end_offset) of the day index
+        self._day_index = None  # offset -> [festival, ...] in library order
+        # (year, month, firstweekday) -> day tuples of iter_month_daytuples, at most MONTH_CACHE_SIZE items
+        self._month_cache = collections.OrderedDict()
+
+    # ----- Derived Structures -----
+
+    def _changed(self):
+        """Drop all derived structures, they will be rebuilt on next access."""
+        self._code_index = None
+        self._name_index = None
+        self._day_index = None
+        self._month_cache = collections.OrderedDict()
+
+    def _added(self, festivals: Sequence[Festival]):
+        """Update derived structures for festivals appended at the end of this library."""
+        self._month_cache = collections.OrderedDict()
+        if self._code_index is not None:
+            for festival in festivals:
+                self._code_index.setdefault(festival.code, []).append(festival)
+        if self._name_index is not None:
+            for festival in festivals:
+                self._name_index.setdefault(festival.name, []).append(festival)
+        if self._day_index is not None:
+            for festival in festivals:
+                for offset in self._iter_festival_offsets(festival, *self._index_range):
+                    self._day_index[offset].append(festival)
+
+    def _removed(self, festivals: Sequence[Festival]):
+        """Update derived structures for festivals removed from this library."""
+        self._month_cache = collections.OrderedDict()
+        if self._code_index is not None:
+            for festival in festivals:
+                self._discard(self._code_index, festival.code, festival)
+        if self._name_index is not None:
+            for festival in festivals:
+                self._discard(self._name_index, festival.name, festival)
+        if self._day_index is not None:
+            for festival in festivals:
+                for offset in self._iter_festival_offsets(festival, *self._index_range):
+                    self._discard(self._day_index, offset, festival)
+
+    @staticmethod
+    def _discard(index: dict, key, festival: Festival):
+        items = index.get(key, [])
+        for i, item in enumerate(items):
+            if item is festival:
+                del items[i]
+                break
+        if not items:
+            index.pop(key, None)
+
+    def _get_code_index(self) -> dict:
+        if self._code_index is None:
+            code_index = {}
+            for festival in self.data:
+                code_index.setdefault(festival.code, []).append(festival)
+            self._code_index = code_index
+        return self._code_index
+
+    def _get_name_index(self) -> dict:
+        if self._name_index is None:
+            name_index = {}
+            for festival in self.data:
+                name_index.setdefault(festival.name, []).append(festival)
+            self._name_index = name_index
+        return self._name_index
+
+    def build_index(self, start_date=None, end_date=None) -> 'FestivalLibrary':
+        """Resolve all festivals in range [start_date, end_date] once, and then get_festival_names in this range
+        become a dict lookup.The index is kept up to date when this library is modified.
+        """
+        start_offset = 0 if start_date is None else _solar_offset(start_date)
+        end_offset = MAX_OFFSET if end_date is None else _solar_offset(end_date)
+        self._index_range = (start_offset, end_offset)
+        self._day_index = None
+        self._get_day_index()
+        return self
+
+    def _get_day_index(self) -> Optional[dict]:
+        if self._day_index is None and self._index_range is not None:
+            start_offset, end_offset = self._index_range
+            day_index = collections.defaultdict(list)
+            for festival in self.data:
+                for offset in self._iter_festival_offsets(festival, start_offset, end_offset):
+                    day_index[offset].append(festival)
+            self._day_index = day_index
+        return self._day_index
+
+    @staticmethod
+    def _iter_festival_offsets(festival: Festival, start_offset: int, end_offset: int) -> Iterator[int]:
+        start_date, end_date = LunarDate._from_offset(start_offset), LunarDate._from_offset(end_offset)
+        for wd in festival.iter_days(start_date, end_date):
+            yield (wd.solar - MIN_SOLAR_DATE).days
+
+    def _lookup_index(self, date_obj: MixedDate) -> Optional[List[Festival]]:
+        """Return the festivals at the date from the day index, or None if the date is not indexed."""
+        if self._index_range is None:
+            return None
+        offset = (LCalendars.cast_date(date_obj, date) - MIN_SOLAR_DATE).days
+        if not self._index_range[0] <= offset <= self._index_range[1]:
+            return None
+        return self._get_day_index().get(offset, [])
+
+    # ----- Mutations -----
+
+    def __contains__(self, item):
+        """Check festival code if item is a str, otherwise check the festival object."""
+        if isinstance(item, str):
+            return item in self._get_code_index()
+        return super().__contains__(item)
+
+    def __copy__(self):
+        inst = super().__copy__()
+        inst._changed()
+        return inst
+
+    def __setitem__(self, i, item):
+        super().__setitem__(i, item)
+        self._changed()
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            removed = self.data[i]
+        else:
+            removed = [self.data[i]]
+        super().__delitem__(i)
+        self._removed(removed)
+
+    def __iadd__(self, other):
+        size = len(self.data)
+        result = super().__iadd__(other)
+        self._added(self.data[size:])
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self._added([item])
+
+    def insert(self, i, item):
+        size = len(self.data)
+        # Normalise the position as list.insert does.
+        pos = min(max(i + size if i < 0 else i, 0), size)
+        super().insert(i, item)
+        if pos == len(self.data) - 1:
+            self._added([item])
+        else:
+            self._changed()
+
+    def pop(self, i=-1):
+        item = super().pop(i)
+        self._removed([item])
+        return item
+
+    def remove(self, item):
+        index = self.data.index(item)
+        del self[index]
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+    def sort(self, *args, **kwds):
+        super().sort(*args, **kwds)
+        self._changed()
+
+    def extend(self, other):
+        size = len(self.data)
+        super().extend(other)
+        self._added(self.data[size:])
+
     def print_(self):
         for festival in self:
             print(festival)
@@ -1011,7 +1307,7 @@ class FestivalLibrary(collections.UserList):
     def get_code_set(self) -> Set[str]:
         """Get codes for all festivals.
         """
-        return set([f.code for f in self.data])
+        return set(self._get_code_index())
 
     def extend_unique(
             self,
@@ -1019,7 +1315,7 @@ class FestivalLibrary(collections.UserList):
     ) -> 'FestivalLibrary':
         """Add a new festival if code does not exist.
         """
-        f_codes = {f.code for f in self.data}
+        f_codes = self._get_code_index()
         if isinstance(other, collections.UserList):
             new_data = other.data
         else:
@@ -1027,12 +1323,12 @@ class FestivalLibrary(collections.UserList):
         for item in new_data:
             if isinstance(item, Festival):
                 if item.code not in f_codes:
-                    self.data.append(item)
+                    self.append(item)
             elif isinstance(item, str):
                 try:
                     festival = decode_festival(item)
                     if item not in f_codes:
-                        self.data.append(festival)
+                        self.append(festival)
                 except ValueError:
                     pass
         return self
@@ -1050,9 +1346,20 @@ class FestivalLibrary(collections.UserList):
 
     def get_festival(self, name: str) -> Optional[Festival]:
         """Get a Festival object by the name."""
-        for festival in self:
-            if festival.name == name:
-                return festival
+        festivals = self._get_name_index().get(name)
+        if festivals:
+            return festivals[0]
+        return None
+
+    def get_festivals(self, name: str) -> List[Festival]:
+        """Get all Festival objects with the name."""
+        return list(self._get_name_index().get(name, []))
+
+    def get_festival_by_code(self, code: str) -> Optional[Festival]:
+        """Get a Festival object by the code."""
+        festivals = self._get_code_index().get(code)
+        if festivals:
+            return festivals[0]
         return None
 
     # ----- Filter Data -----
@@ -1098,6 +1405,9 @@ class FestivalLibrary(collections.UserList):
 
     def get_festival_names(self, date_obj: MixedDate) -> list:
         """Get name list for a date object."""
+        festivals = self._lookup_index(date_obj)
+        if festivals is not None:
+            return [festival.name for festival in festivals]
         names = []
         for festival in self:
             if festival.is_(date_obj):
@@ -1140,50 +1450,125 @@ class FestivalLibrary(collections.UserList):
             data_items.sort(key=lambda item: (item[0], item[2].catalog_order))
         return data_items
 
+    def list_next_days(self, count: int = 10, date_obj: MixedDate = None) -> List[Tuple[int, WrappedDate, Festival]]:
+        """Return the first count days of all festivals since date_obj, ordered by days and catalog.
+        The format of items is same as list_days_in_countdown.
+        """
+        if date_obj is None:
+            date_obj = date.today()
+        return [
+            (LCalendars.delta(day, date_obj), day, festival)
+            for day, festival in itertools.islice(self.iter_days(start_date=date_obj), count)
+        ]
+
     def list_days(self, start_date=None, end_date=None):
         """Return the day list matched festivals in this library."""
-        data_items = []
-        for festival in self:
-            day_list = festival.list_days(start_date, end_date)
-            for day in day_list:
-                data_items.append([day, festival])
-        data_items.sort(key=lambda item: (item[0].solar, item[1].catalog_order))
-        return data_items
+        return [[day, festival] for day, festival in self.iter_days(start_date, end_date)]
+
+    def iter_days(self, start_date=None, end_date=None, reverse: bool = False) -> Iterator[Tuple[WrappedDate, Festival]]:
+        """Yield (day, festival) of all festivals in this library ordered by (day, catalog).
+        The days of each festival are resolved lazily and merged, so consumers can take the first items cheaply.
+        """
+
+        def _iter_items(_festival):
+            _catalog_order = _festival.catalog_order
+            for _day in _festival.iter_days(start_date, end_date, reverse):
+                yield _day.solar, _catalog_order, _day, _festival
+
+        streams = [_iter_items(festival) for festival in self.data]
+        for _, _, day, festival in heapq.merge(*streams, key=lambda item: item[:2], reverse=reverse):
+            yield day, festival
 
     def iter_month_daytuples(self, year: int, month: int, firstweekday: int = 0, return_pos: bool = False):
         """return all day info for a whole solar month as (day_integer, day_text, wrapped_date)
         The day_text show in the order:festival_name,term_name, lunar_day_text
         """
-        row = 0
+        for day, text, wd, row, col in self._get_month_daytuples(year, month, firstweekday):
+            if return_pos:
+                yield day, text, wd, row, col
+            else:
+                yield day, text, wd
+
+    def _get_month_daytuples(self, year: int, month: int, firstweekday: int = 0) -> list:
+        """Return (day, text, wrapped_date, row, col) of all cells.
+
+        The recently used months are cached until this library is modified, and the callers get new WrappedDate
+        objects of the cached cells.
+        """
+        key = (year, month, firstweekday)
+        cache = self._month_cache
+        cells = cache.get(key)
+        if cells is None:
+            cells = self._build_month_daytuples(year, month, firstweekday)
+            cache[key] = cells
+            # Each OrderedDict call is atomic, so the cache is only trimmed and never raises in threads.
+            while len(cache) > self.MONTH_CACHE_SIZE:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    break
+        else:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass
+        return [(day, text, wd and WrappedDate(wd, wd.name), row, col) for day, text, wd, row, col in cells]
+
+    def _get_day_festivals(self, first_day: date, last_day: date) -> dict:
+        """Return offset -> festivals in library order for all days in the range."""
+        start_offset, end_offset = LunarDate.from_solar(first_day).offset, LunarDate.from_solar(last_day).offset
+        index_range = self._index_range
+        if index_range is not None and index_range[0] <= start_offset and end_offset <= index_range[1]:
+            return self._get_day_index()
+        # Resolve festivals once for the whole range instead of checking every day.
+        day_festivals = collections.defaultdict(list)
+        for festival in self.data:
+            for wd in festival.iter_days(first_day, last_day):
+                day_festivals[(wd.solar - MIN_SOLAR_DATE).days].append(festival)
+        return day_festivals
+
+    def _build_month_daytuples(self, year: int, month: int, firstweekday: int, day_festivals: dict = None) -> list:
+        first_day = date(year, month, 1)
+        last_day = date(year, month, calendar.monthrange(year, month)[1])
+        start_offset, end_offset = LunarDate.from_solar(first_day).offset, LunarDate.from_solar(last_day).offset
+        if day_festivals is None:
+            day_festivals = self._get_day_festivals(first_day, last_day)
+        lunar_days = _iter_offset_ymdl(start_offset, end_offset)
+
+        cells = []
         cal = calendar.Calendar(firstweekday=firstweekday)
-        for days in cal.monthdayscalendar(year, month):
+        for row, days in enumerate(cal.monthdayscalendar(year, month)):
             for col, day in enumerate(days):
                 if day == 0:
-                    text = ''
-                    wd = None
-                else:
-                    ld = LunarDate.from_solar_date(year, month, day)
-                    text = ''
-                    names = self.get_festival_names(ld)
-                    if names:
-                        text = names[0]
-                    if ld.term and not text:
-                        text = ld.term
-                    elif not text:
-                        text = ld.cn_day_calendar
-                    wd = WrappedDate(ld)
-                if return_pos:
-                    yield day, text, wd, row, col
+                    cells.append((day, '', None, row, col))
+                    continue
+                offset, ymdl = next(lunar_days)
+                ld = LunarDate._from_offset(offset, ymdl)
+                festivals = day_festivals.get(offset)
+                if festivals:
+                    text = festivals[0].name
                 else:
-                    yield day, text, wd
-            row += 1
+                    text = ld.term or ld.cn_day_calendar
+                cells.append((day, text, WrappedDate(ld), row, col))
+        return cells
 
     def monthdaycalendar(self, year: int, month: int, firstweekday: int = 0):
         """返回二维列表，每一行表示一个星期。逻辑同iter_month_daytuples。
         """
-        days = list(self.iter_month_daytuples(year, month, firstweekday))
+        days = [cell[:3] for cell in self._get_month_daytuples(year, month, firstweekday)]
         return [days[i:i + 7] for i in range(0, len(days), 7)]
 
+    def yeardaycalendar(self, year: int, firstweekday: int = 0) -> list:
+        """Return a list of 12 items for the months of a solar year, each of which is same as monthdaycalendar.
+        All festivals are resolved once for the whole year, and the months are not kept in the month cache.
+        """
+        day_festivals = self._get_day_festivals(date(year, 1, 1), date(year, 12, 31))
+        months = []
+        for month in range(1, 13):
+            days = [cell[:3] for cell in self._build_month_daytuples(year, month, firstweekday, day_festivals)]
+            months.append([days[i:i + 7] for i in range(0, len(days), 7)])
+        return months
+
     def to_csv(self, path_or_buf):
         """Save festival list data to a csv file."""
         if isinstance(path_or_buf, str):
@@ -1197,30 +1582,129 @@ class FestivalLibrary(collections.UserList):
             row = (festival.code, festival.name, festival.catalog)
             writer.writerow(row)
 
+    @staticmethod
+    def _compiled_header() -> bytes:
+        """Return the header: magic, COMPILED_VERSION, marshal version and the python version."""
+        versions = FestivalLibrary.COMPILED_VERSION.to_bytes(2, 'little') + bytes((marshal.version,) + sys.version_info[:2])
+        return FestivalLibrary.COMPILED_MAGIC + versions
+
+    def save_compiled(self, path_or_buf):
+        """Save festival list data to a compiled binary file, which is loaded by load_compiled without parsing.
+
+        The file starts with a header of COMPILED_MAGIC, COMPILED_VERSION, the marshal version and the python version,
+        followed by the marshalled attributes of festivals.It is bound to the borax and python versions,
+        so compile it again after upgrading them.
+        A ValueError is raised if a festival can not be restored by load_compiled, such as an object of a subclass
+        or with extra attributes, and the file is not written.
+        """
+        # The attribute names are stored once for the festivals with the same layout.
+        layouts, items = {}, []
+        for festival in self.data:
+            festival_class = FestivalLibrary._compiled_festival_class(festival.schema, festival.__dict__)
+            if type(festival) is not festival_class:
+                raise ValueError(f'Unable to compile {type(festival).__name__}, only {festival_class.__name__} is supported.')
+            state = dict(festival.__dict__)
+            state['_schema'] = int(festival.schema)
+            layout_index = layouts.setdefault(tuple(state), len(layouts))
+            items.append((layout_index, tuple(state.values())))
+        data = FestivalLibrary._compiled_header() + marshal.dumps((tuple(layouts), tuple(items)))
+        if isinstance(path_or_buf, (str, Path)):
+            with open(path_or_buf, 'wb') as f:
+                f.write(data)
+        else:
+            path_or_buf.write(data)
+
+    @classmethod
+    def load_compiled(cls, path_or_buf) -> 'FestivalLibrary':
+        """Load festival list from a file created by save_compiled.
+        A ValueError is raised if the file is not a compiled file, it is created by other borax/python versions,
+        or its content is broken.
+
+        The content is read by marshal.loads, which is not secure against malicious data,
+        so never load a file from an untrusted source.
+        """
+        if isinstance(path_or_buf, (str, Path)):
+            with open(path_or_buf, 'rb') as f:
+                return cls.load_compiled(f)
+        expected_header = FestivalLibrary._compiled_header()
+        header = path_or_buf.read(len(expected_header))
+        if header[:4] != FestivalLibrary.COMPILED_MAGIC:
+            raise ValueError('Not a compiled festival file.')
+        if header != expected_header:
+            raise ValueError('The compiled festival file is created by other borax or python version, compile it again.')
+        try:
+            layouts, items = marshal.loads(path_or_buf.read())
+            festivals = [cls._restore_festival(layouts[layout_index], values) for layout_index, values in items]
+        except (EOFError, TypeError, ValueError, IndexError, KeyError) as e:
+            raise ValueError(f'Invalid compiled festival file: {e}') from e
+        return cls(festivals)
+
+    @staticmethod
+    def _compiled_festival_class(schema: FestivalSchema, attr_names) -> type:
+        """Return the festival class of schema, or raise ValueError if attr_names is not its attribute layout."""
+        festival_class, attrs = _compiled_festival_attrs()[schema]
+        # The code is cached only after it is accessed.
+        if not attrs <= set(attr_names) <= attrs | {'code'}:
+            raise ValueError(f'Unexpected attributes for {festival_class.__name__}.')
+        return festival_class
+
+    @staticmethod
+    def _restore_festival(layout: tuple, values: tuple) -> Festival:
+        schema = FestivalSchema(values[layout.index('_schema')])
+        festival_class = FestivalLibrary._compiled_festival_class(schema, layout)
+        if len(layout) != len(values):
+            raise ValueError(f'Unexpected attributes for {festival_class.__name__}.')
+        festival = festival_class.__new__(festival_class)  # The attributes are restored without validation.
+        festival.__dict__.update(zip(layout, values))
+        festival._schema = schema
+        return festival
+
     @classmethod
     def load_file(cls, file_path: Union[str, Path], unique: bool = False) -> 'FestivalLibrary':
-        """Load festival list from a external file."""
+        """Load festival list from a external file.
+
+        The parsed festivals are cached in process by (path, mtime, size), and each call returns a new library
+        with copies of them.The file is parsed again once it is modified.
+        """
         if isinstance(file_path, str):
             file_path = Path(file_path)
-        fl = cls()
+        try:
+            stat = file_path.stat()
+            key = (str(file_path.resolve()), unique)
+        except OSError:
+            return cls(cls._parse_file(file_path, unique))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = FestivalLibrary._load_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            festivals = cached[1]
+        else:
+            festivals = tuple(cls._parse_file(file_path, unique))
+            FestivalLibrary._load_cache[key] = (signature, festivals)
+        return cls([copy.copy(festival) for festival in festivals])
+
+    @staticmethod
+    def clear_load_cache():
+        """Clear the parsed festivals cached by load_file."""
+        FestivalLibrary._load_cache.clear()
+
+    @staticmethod
+    def _parse_file(file_path: Path, unique: bool = False) -> List[Festival]:
+        fl = FestivalLibrary()
         field_names = ['raw', 'name', 'catalog']
         with file_path.open(encoding='utf8') as f:
             reader = csv.DictReader(f, fieldnames=field_names)
-            code_set = fl.get_code_set()
             for row in reader:
-                code = row['raw']
-                if unique and code in code_set:
-                    continue
-                code_set.add(code)
                 try:
                     festival = decode_festival(row['raw'])
-                    festival.set_name(row['name'])
-                    festival.catalog = row.get('catalog')
-                    fl.append(festival)
                 except ValueError:
                     continue
+                if unique and festival.code in fl:
+                    continue
+                festival.set_name(row['name'])
+                festival.catalog = row.get('catalog')
+                fl.append(festival)
         fl.sort(key=lambda x: x.code)
-        return fl
+        return fl.data
 
     def filter(self, catalogs: Sequence = None) -> 'FestivalLibrary':
         """Return a new FestivalLibrary object filtered by query conditions."""
@@ -1,4 +1,8 @@
+import bisect
 import datetime
+import functools
+import itertools
+import operator
 import re
 import warnings
 from typing import Optional, Iterator, Tuple, TypeVar, Sequence, Union
@@ -97,6 +101,36 @@ def _iter_year_month(year_info):
         yield month, days, leap
 
 
+# Offset index for lunar years and months, built once at import.
+# YEAR_START_OFFSETS[i] : the offset of the first day in lunar year 1900+i, the last element is MAX_OFFSET + 1
+# _YEAR_MONTHS[i] : ((month, ndays, leap), ...) for lunar year 1900+i
+# _MONTH_START_OFFSETS[i] : the day offsets of the first day for each month in lunar year 1900+i
+# _MONTH_INDEXES[i] : {(month, leap): (day_offset, ndays)}
+# _YEAR_MONTH_LAYOUTS[i] : ((month, ndays, leap, start_offset), ...) for lunar year 1900+i
+# _LEAP_MONTHS[i] : the leap month of lunar year 1900+i, 0 if there is not leap month
+
+YEAR_START_OFFSETS = tuple(itertools.accumulate(YEAR_DAYS, initial=0))
+
+
+def _build_month_tables():
+    year_months, month_start_offsets, month_indexes = [], [], []
+    for year_info in YEAR_INFOS:
+        months = tuple(_iter_year_month(year_info))
+        starts = tuple(itertools.accumulate([days for _, days, _ in months[:-1]], initial=0))
+        year_months.append(months)
+        month_start_offsets.append(starts)
+        month_indexes.append({(m, leap): (start, days) for (m, days, leap), start in zip(months, starts)})
+    return tuple(year_months), tuple(month_start_offsets), tuple(month_indexes)
+
+
+_YEAR_MONTHS, _MONTH_START_OFFSETS, _MONTH_INDEXES = _build_month_tables()
+_YEAR_MONTH_LAYOUTS = tuple(
+    tuple((month, ndays, leap, year_start + start) for (month, ndays, leap), start in zip(months, starts))
+    for months, starts, year_start in zip(_YEAR_MONTHS, _MONTH_START_OFFSETS, YEAR_START_OFFSETS)
+)
+_LEAP_MONTHS = tuple(_parse_leap(year_info)[0] for year_info in YEAR_INFOS)
+
+
 class LCalendars:
     """A public API for lunar calendar.
     """
@@ -105,14 +139,21 @@ class LCalendars:
     def leap_month(year: int) -> int:
         """Get the leap month in a lunar year.Return 0 if there is not leap month."""
         _check_year_range(year)
-        leap_month, _ = _parse_leap(YEAR_INFOS[year - MIN_LUNAR_YEAR])
-        return leap_month
+        return _LEAP_MONTHS[year - MIN_LUNAR_YEAR]
 
     @staticmethod
     def iter_year_month(year: int) -> Iterator[Tuple[int, int, int]]:
         """Yield month info in a lunar year. (month, ndays, leap)"""
         _check_year_range(year)
-        return _iter_year_month(YEAR_INFOS[year - MIN_LUNAR_YEAR])
+        return iter(_YEAR_MONTHS[year - MIN_LUNAR_YEAR])
+
+    @staticmethod
+    def year_month_layout(year: int) -> Tuple[Tuple[int, int, int, int], ...]:
+        """Return month info in a lunar year. ((month, ndays, leap, start_offset), ...)
+        start_offset is the offset of the first day in the month.
+        """
+        _check_year_range(year)
+        return _YEAR_MONTH_LAYOUTS[year - MIN_LUNAR_YEAR]
 
     @staticmethod
     def ndays(year: int, month: Optional[int] = None, leap: int = 0) -> int:
@@ -121,21 +162,18 @@ class LCalendars:
         if month is None:
             return YEAR_DAYS[year - MIN_LUNAR_YEAR]
         leap = int(bool(leap))
-        for _month, _days, _leap in LCalendars.iter_year_month(year):
-            if (_month, _leap) == (month, leap):
-                return _days
-        else:
-            raise InvalidLunarDateError(f'[year={year},month={month},leap={leap}]: Invalid month.')
+        try:
+            return _MONTH_INDEXES[year - MIN_LUNAR_YEAR][(month, leap)][1]
+        except KeyError:
+            raise InvalidLunarDateError(f'[year={year},month={month},leap={leap}]: Invalid month.') from None
 
     @staticmethod
     def get_leap_years(month: int = 0) -> tuple:
         """Get year list which has the leap month."""
-        res = []
-        for yoffset, yinfo in enumerate(YEAR_INFOS):
-            leap_month = yinfo % 16
-            if leap_month > 0 and (month == 0 or leap_month == month):
-                res.append(MIN_LUNAR_YEAR + yoffset)
-        return tuple(res)
+        return tuple(
+            MIN_LUNAR_YEAR + yoffset for yoffset, leap_month in enumerate(_LEAP_MONTHS)
+            if leap_month > 0 and (month == 0 or leap_month == month)
+        )
 
     @staticmethod
     def create_solar_date(year: int, term_index: Optional[int] = None,
@@ -161,56 +199,98 @@ class LCalendars:
         date2 = LCalendars.cast_date(date2, type(date1))
         return (date1 - date2).days
 
+    @staticmethod
+    def iter_dates(start_date=None, end_date=None, step: int = 1, reverse: bool = False,
+                   wrapped: bool = False) -> Iterator:
+        """Yield the dates in range [start_date, end_date] every step days.
+
+        :param start_date: a date/LunarDate/WrappedDate object, default LunarDate.min
+        :param end_date: a date/LunarDate/WrappedDate object, default LunarDate.max
+        :param step: the day delta between two dates, it must be positive
+        :param reverse: yield from end_date to start_date if True
+        :param wrapped: yield WrappedDate objects instead of LunarDate objects if True
+        """
+        if step < 1:
+            raise ValueError(f'Invalid step: {step}')
+        start_offset = 0 if start_date is None else _solar_offset(start_date)
+        end_offset = MAX_OFFSET if end_date is None else _solar_offset(end_date)
+        if wrapped:
+            from .festivals2 import WrappedDate
+        for offset, ymdl in _iter_offset_ymdl(start_offset, end_offset, step, reverse):
+            ld = LunarDate._from_offset(offset, ymdl)
+            yield WrappedDate(ld) if wrapped else ld
+
 
 # offset <----> year, day_offset <----> year, month, day, leap
 
-def offset2ymdl(offset: int) -> Tuple[int, int, int, int]:
-    def _o2mdl(_year_info, _offset):
-        for _month, _days, _leap in _iter_year_month(_year_info):
-            if _offset < _days:
-                break
-            _offset -= _days
-        else:
-            raise ValueError('Out of range.')
-        return _month, _offset + 1, _leap
+def _solar_offset(date_obj) -> int:
+    """Return the offset of a date/LunarDate/WrappedDate object."""
+    offset = (LCalendars.cast_date(date_obj, datetime.date) - MIN_SOLAR_DATE).days
+    if not 0 <= offset <= MAX_OFFSET:
+        raise InvalidLunarDateError(f'[offset={offset}]: Out of range.')
+    return offset
 
-    offset = int(offset)
 
-    for idx, year_day in enumerate(YEAR_DAYS):
-        if offset < year_day:
-            break
-        offset -= year_day
+def offset2ymdl(offset: int) -> Tuple[int, int, int, int]:
+    offset = int(offset)
+    if not 0 <= offset <= MAX_OFFSET:
+        raise InvalidLunarDateError(f'[offset={offset}]: Out of range.')
+    year_idx = bisect.bisect_right(YEAR_START_OFFSETS, offset) - 1
+    day_offset = offset - YEAR_START_OFFSETS[year_idx]
+    month_starts = _MONTH_START_OFFSETS[year_idx]
+    month_idx = bisect.bisect_right(month_starts, day_offset) - 1
+    month, _, leap = _YEAR_MONTHS[year_idx][month_idx]
+    return MIN_LUNAR_YEAR + year_idx, month, day_offset - month_starts[month_idx] + 1, leap
+
+
+def _iter_offset_ymdl(start_offset: int, end_offset: int, step: int = 1, reverse: bool = False):
+    """Yield (offset, (year, month, day, leap)) by walking the month tables incrementally."""
+    if start_offset > end_offset:
+        return
+    if reverse:
+        offset, step = end_offset, -step
     else:
-        raise ValueError('Out of range')
-    year = MIN_LUNAR_YEAR + idx
-
-    year_info = YEAR_INFOS[idx]
-    month, day, leap = _o2mdl(year_info, offset)
-    return year, month, day, leap
+        offset = start_offset
+    year_idx = bisect.bisect_right(YEAR_START_OFFSETS, offset) - 1
+    day_offset = offset - YEAR_START_OFFSETS[year_idx]
+    month_idx = bisect.bisect_right(_MONTH_START_OFFSETS[year_idx], day_offset) - 1
+    day = day_offset - _MONTH_START_OFFSETS[year_idx][month_idx] + 1
+    months = _YEAR_MONTHS[year_idx]
+    while start_offset <= offset <= end_offset:
+        month, ndays, leap = months[month_idx]
+        yield offset, (MIN_LUNAR_YEAR + year_idx, month, day, leap)
+        offset += step
+        day += step
+        while day > ndays:
+            day -= ndays
+            month_idx += 1
+            if month_idx == len(months):
+                year_idx += 1
+                if year_idx == len(_YEAR_MONTHS):
+                    return
+                months, month_idx = _YEAR_MONTHS[year_idx], 0
+            ndays = months[month_idx][1]
+        while day < 1:
+            month_idx -= 1
+            if month_idx < 0:
+                year_idx -= 1
+                if year_idx < 0:
+                    return
+                months = _YEAR_MONTHS[year_idx]
+                month_idx = len(months) - 1
+            day += months[month_idx][1]
 
 
 def ymdl2offset(year, month, day, leap):
-    def _mdl2o(_year_info, _month, _day, _leap):
-        _leap = int(_leap)
-        res = 0
-        for _month_, _days_, _leap_ in _iter_year_month(_year_info):
-            if (_month_, _leap_) == (_month, _leap):
-                if 1 <= _day <= _days_:
-                    res += _day - 1
-                    return res
-                else:
-                    raise InvalidLunarDateError(f"[year={year},month={month},day={day},leap={leap}]:Invalid day")
-            res += _days_
-
-        raise InvalidLunarDateError(f'[year={year},month={month},leap={leap}]: Invalid month.')
-
-    offset = 0
     _check_year_range(year)
     year_idx = year - MIN_LUNAR_YEAR
-    for i in range(year_idx):
-        offset += YEAR_DAYS[i]
-    offset += _mdl2o(YEAR_INFOS[year_idx], month, day, leap)
-    return offset
+    try:
+        month_start, ndays = _MONTH_INDEXES[year_idx][(month, int(leap))]
+    except KeyError:
+        raise InvalidLunarDateError(f'[year={year},month={month},leap={leap}]: Invalid month.') from None
+    if not 1 <= day <= ndays:
+        raise InvalidLunarDateError(f"[year={year},month={month},day={day},leap={leap}]:Invalid day")
+    return YEAR_START_OFFSETS[year_idx] + month_start + day - 1
 
 
 # ------ Term Info ------
@@ -278,6 +358,19 @@ TERM_INFO = [
 ]
 
 
+def _build_term_days():
+    values = bytearray()
+    for term_info in TERM_INFO:
+        values.extend(int(c) + 15 * (i % 2) for i, c in enumerate(term_info))
+    values.extend((5, 20))  # 2101: 小寒 / 大寒
+    return bytes(values)
+
+
+# The solar days of 24 terms for every solar year 1900~2100, and the first 2 terms in 2101.
+# The day of term_index in year is TERM_DAYS[(year - 1900) * 24 + term_index]
+TERM_DAYS = _build_term_days()
+
+
 def delta_in_cycle(data_list: Sequence[T], start_ele: T, nth: int, end_ele: T) -> int:
     if nth == 0:
         return 0
@@ -317,12 +410,8 @@ class TermUtils:
 
     @staticmethod
     def parse_term_days(year):
-        if year == 2101:
-            return [5, 20]
-        value_offset = [0, 15]
-        year_index = year - 1900
-        days = [int(c) + value_offset[i % 2] for i, c in enumerate(TERM_INFO[year_index])]
-        return days
+        start = (year - 1900) * 24
+        return list(TERM_DAYS[start:start + 24])
 
     @staticmethod
     def get_term_info(year, month, day):
@@ -330,11 +419,11 @@ class TermUtils:
         (sy, sm, sd) => (term, next_gz_month)
         term for year 2101,:2101.1.5(初六) 小寒 2101.1.20(廿一) 大寒
         """
-        days = TermUtils.parse_term_days(year)
         term_index1 = 2 * (month - 1)
-        term_index2 = 2 * (month - 1) + 1
-        day1 = days[term_index1]
-        day2 = days[term_index2]
+        term_index2 = term_index1 + 1
+        pos = (year - 1900) * 24 + term_index1
+        day1 = TERM_DAYS[pos]
+        day2 = TERM_DAYS[pos + 1]
         if day == day1:
             term_name = TERMS_CN[term_index1]
         elif day == day2:
@@ -363,8 +452,7 @@ class TermUtils:
             month = term_index // 2 + 1
         else:
             month = (term_index + 1) // 2
-        days = TermUtils.parse_term_days(year)
-        day = days[term_index]
+        day = TERM_DAYS[(year - 1900) * 24 + term_index]
         return datetime.date(year, month, day)
 
     @staticmethod
@@ -419,6 +507,13 @@ class TextUtils:
 
     @staticmethod
     def year_cn(year: int) -> str:
+        try:
+            return CN_YEAR_TABLE[year]
+        except KeyError:
+            return TextUtils._year_cn(year)
+
+    @staticmethod
+    def _year_cn(year: int) -> str:
         s = ''.join([TextUtils.MONTHS_CN[int(c)] for c in str(year)])
         return s.replace('正', '一')
 
@@ -428,6 +523,13 @@ class TextUtils:
 
     @staticmethod
     def day_cn(day: int) -> str:
+        try:
+            return CN_DAY_TABLE[day]
+        except KeyError:
+            return TextUtils._day_cn(day)
+
+    @staticmethod
+    def _day_cn(day: int) -> str:
         a, b = divmod(day, 10)
         if b == 0:  # 10,20,30
             if a == 1:
@@ -447,12 +549,8 @@ class TextUtils:
     def gz2offset(gz: str) -> int:
         """Get the index of given string in gz_list. ['甲子', '乙丑',..., '癸亥']"""
         try:
-            x = TextUtils.STEMS.index(gz[0])
-            y = TextUtils.BRANCHES.index(gz[1])
-            if x % 2 != y % 2:
-                raise ValueError
-            return (6 * x - 5 * y) % 60
-        except (TypeError, ValueError) as e:
+            return GZ_OFFSET_TABLE[gz[:2]]
+        except (TypeError, KeyError) as e:
             raise ValueError(f'Invalid gz string: {gz}') from e
 
     @staticmethod
@@ -462,7 +560,25 @@ class TextUtils:
         >>> TextUtils.offset2gz(0)
         '甲子'
         """
-        return TextUtils.STEMS[offset % 10] + TextUtils.BRANCHES[offset % 12]
+        return GZ_TABLE[offset % 60]
+
+
+# Precomputed text tables for TextUtils.
+CN_YEAR_TABLE = {year: TextUtils._year_cn(year) for year in range(MIN_LUNAR_YEAR, MAX_LUNAR_YEAR + 2)}
+CN_DAY_TABLE = {day: TextUtils._day_cn(day) for day in range(1, 31)}
+GZ_TABLE = tuple(TextUtils.STEMS[i % 10] + TextUtils.BRANCHES[i % 12] for i in range(60))
+GZ_OFFSET_TABLE = {gz: i for i, gz in enumerate(GZ_TABLE)}
+CN_MONTH_NUM_TABLE = tuple(TextUtils.MONTHS_CN[:11]) + ('十一', '十二')
+
+
+def _gz_ymd_term(offset: int, year: int, solar_date: Optional[datetime.date] = None) -> Tuple[str, str, str, str]:
+    """Return (gz_year, gz_month, gz_day, term) for the offset whose lunar year is year."""
+    if solar_date is None:
+        solar_date = MIN_SOLAR_DATE + datetime.timedelta(days=offset)
+    sy, sm, sd = solar_date.year, solar_date.month, solar_date.day
+    term_name, next_gz_month = TermUtils.get_term_info(sy, sm, sd)
+    gz_month = GZ_TABLE[((sy - 1900) * 12 + sm + 11 + next_gz_month) % 60]
+    return GZ_TABLE[(year - 4) % 60], gz_month, GZ_TABLE[(offset + 40) % 60], term_name
 
 
 class LunarDate:
@@ -482,6 +598,9 @@ class LunarDate:
     >>> ld1.after(day_delta=10)
     LunarDate(2020, 4, 11, 0)
     """
+    __slots__ = ('_year', '_month', '_day', '_leap', '_offset', '_gz_info')
+
+    _interned = None  # A dict of offset -> LunarDate when the flyweight cache is enabled.
 
     def __init__(self, year: int, month: int, day: int, leap: int = 0):
         offset = ymdl2offset(year, month, day, leap)
@@ -490,7 +609,7 @@ class LunarDate:
         self._day = day
         self._leap = leap
         self._offset = offset
-        self._gz_year, self._gz_month, self._gz_day, self._term = self._get_gz_ymd()
+        self._gz_info = None  # (gz_year, gz_month, gz_day, term), computed on first access.
 
     @property
     def year(self) -> int:
@@ -514,39 +633,34 @@ class LunarDate:
 
     @property
     def term(self) -> str:
-        return self._term
+        return self._get_gz_info()[3]
 
     @property
     def gz_year(self) -> str:
-        return self._gz_year
+        return self._get_gz_info()[0]
 
     @property
     def gz_month(self) -> str:
-        return self._gz_month
+        return self._get_gz_info()[1]
 
     @property
     def gz_day(self) -> str:
-        return self._gz_day
+        return self._get_gz_info()[2]
 
     @property
     def animal(self) -> str:
         return TextUtils.ANIMALS[(self.year - 4) % 12]
 
+    def _get_gz_info(self):
+        if self._gz_info is None:
+            self._gz_info = self._get_gz_ymd()
+        return self._gz_info
+
     def _get_gz_ymd(self):
         """
         (sy, sm, sd) -> term / gz_year / gz_month / gz_day
         """
-        solar_date = MIN_SOLAR_DATE + datetime.timedelta(days=self._offset)
-        sy, sm, sd = solar_date.year, solar_date.month, solar_date.day
-        s_offset = (datetime.date(sy, sm, sd) - MIN_SOLAR_DATE).days
-        gz_year = TextUtils.STEMS[(self.year - 4) % 10] + TextUtils.BRANCHES[(self.year - 4) % 12]
-        gz_day = TextUtils.offset2gz((s_offset + 40) % 60)
-        term_name, next_gz_month = TermUtils.get_term_info(sy, sm, sd)
-        if next_gz_month:
-            gz_month = TextUtils.offset2gz((sy - 1900) * 12 + sm + 12)
-        else:
-            gz_month = TextUtils.offset2gz((sy - 1900) * 12 + sm + 11)
-        return gz_year, gz_month, gz_day, term_name
+        return _gz_ymd_term(self._offset, self._year)
 
     @property
     def cn_year(self) -> str:
@@ -566,8 +680,7 @@ class LunarDate:
 
     @property
     def cn_month_num(self) -> str:
-        mstr = self.cn_month
-        return {'冬': '十一', '腊': '十二'}.get(mstr, mstr)
+        return CN_MONTH_NUM_TABLE[self.month]
 
     @property
     def cn_day_calendar(self) -> str:
@@ -603,12 +716,10 @@ class LunarDate:
         return MIN_SOLAR_DATE + datetime.timedelta(days=self.offset)
 
     def before(self, day_delta: int = 1) -> 'LunarDate':
-        y, m, d, leap = offset2ymdl(self._offset - day_delta)
-        return LunarDate(y, m, d, leap)
+        return LunarDate._from_offset(self._offset - day_delta)
 
     def after(self, day_delta: int = 1) -> 'LunarDate':
-        y, m, d, leap = offset2ymdl(self._offset + day_delta)
-        return LunarDate(y, m, d, leap)
+        return LunarDate._from_offset(self._offset + day_delta)
 
     def replace(self, *, year: Optional[int] = None, month: Optional[int] = None, day: Optional[int] = None,
                 leap: Optional[int] = None):
@@ -623,7 +734,7 @@ class LunarDate:
         return type(self)(year, month, day, leap)
 
     def strftime(self, fmt: str) -> str:
-        return Formatter(fmt).format(self)
+        return Formatter.get(fmt).format(self)
 
     def __format__(self, fmt):
         if not isinstance(fmt, str):
@@ -639,9 +750,36 @@ class LunarDate:
 
     @classmethod
     def from_solar(cls, date_obj: datetime.date) -> 'LunarDate':
-        offset = (date_obj - MIN_SOLAR_DATE).days
-        y, m, d, leap = offset2ymdl(offset)
-        return cls(y, m, d, leap)
+        return cls._from_offset((date_obj - MIN_SOLAR_DATE).days)
+
+    @classmethod
+    def _from_offset(cls, offset: int, ymdl: Optional[Tuple[int, int, int, int]] = None) -> 'LunarDate':
+        """Create a object from the offset without validating (year, month, day, leap) again.
+        ymdl is the known (year, month, day, leap) for the offset.
+        """
+        interned = LunarDate._interned if cls is LunarDate else None
+        if interned is not None and offset in interned:
+            return interned[offset]
+        obj = cls.__new__(cls)
+        obj._year, obj._month, obj._day, obj._leap = ymdl or offset2ymdl(offset)
+        obj._offset = offset
+        obj._gz_info = None
+        if interned is not None:
+            interned[offset] = obj
+        return obj
+
+    @staticmethod
+    def enable_intern(enabled: bool = True):
+        """Share one LunarDate instance per date for the objects created from solar dates.
+
+        There are only MAX_OFFSET + 1 lunar dates, so the cache holds at most 73412 objects.
+        Disabling it clears the cache.
+        """
+        if enabled:
+            if LunarDate._interned is None:
+                LunarDate._interned = {}
+        else:
+            LunarDate._interned = None
 
     @classmethod
     def today(cls) -> 'LunarDate':
@@ -661,7 +799,8 @@ class LunarDate:
     @classmethod
     def last_day(cls, year: int, month: int = 0, leap: int = 0) -> 'LunarDate':
         """return the last day in a lunar year or a lunar month."""
-        mdls = list(LCalendars.iter_year_month(year))
+        _check_year_range(year)
+        mdls = _YEAR_MONTHS[year - MIN_LUNAR_YEAR]
         if month == 0:
             index = -1
         else:
@@ -703,8 +842,7 @@ class LunarDate:
         elif isinstance(other, datetime.date):
             return self.to_solar_date() - other
         elif isinstance(other, datetime.timedelta):
-            res = self.to_solar_date() - other
-            return LunarDate.from_solar_date(res.year, res.month, res.day)
+            return LunarDate._from_offset(self._offset - other.days)
         raise TypeError
 
     def __rsub__(self, other):
@@ -714,8 +852,7 @@ class LunarDate:
 
     def __add__(self, other):
         if isinstance(other, datetime.timedelta):
-            res = self.to_solar_date() + other
-            return LunarDate.from_solar_date(res.year, res.month, res.day)
+            return LunarDate._from_offset(self._offset + other.days)
         raise TypeError
 
     def __radd__(self, other):
@@ -750,6 +887,8 @@ class LunarDate:
 
     def __setstate__(self, state):
         self._year, self._month, self._day, self._leap = state
+        self._offset = ymdl2offset(*state)
+        self._gz_info = None
 
 
 LunarDate.min = LunarDate(1900, 1, 1, 0)
@@ -785,24 +924,46 @@ class Formatter:
     }
 
     def __init__(self, fmt: str):
-        self._fields = set({})
+        self._resolvers = []
         pattern = re.compile('|'.join(self.directives.keys()))
-        self._fmt = pattern.sub(self.replace_rex, fmt)
+        self._fmt = pattern.sub(self.replace_rex, fmt.replace('{', '{{').replace('}', '}}'))
 
     def replace_rex(self, match):
         directive = match.group()
         if directive == '%%':
             return '%'
-        field = self.directives[directive]
-        self._fields.add(field)
-        return ''.join(['{', field, '}'])
+        self._resolvers.append(self._build_resolver(self.directives[directive]))
+        return '{}'
+
+    def _build_resolver(self, field):
+        """Return a callable obj -> value for the field, which is resolved once when compiling."""
+        func = getattr(self, 'get_' + field, None)
+        if func is not None:
+            return func
+        attr = getattr(LunarDate, field, None)
+        if isinstance(attr, property):
+            return operator.attrgetter(field)
+        elif callable(attr):
+            return operator.methodcaller(field)
+        return functools.partial(self.resolve, field=field)
 
     def format(self, obj: LunarDate) -> str:
-        def xstr(s):
-            return '' if s is None else str(s)
+        values = [resolver(obj) for resolver in self._resolvers]
+        return self._fmt.format(*['' if v is None else v for v in values])
+
+    def format_many(self, objs) -> list:
+        """Format a sequence of LunarDate / WrappedDate objects with this format.
 
-        values = {f: xstr(self.resolve(obj, f)) for f in self._fields}
-        return self._fmt.format(**values)
+        >>> Formatter('%y-%m-%d').format_many([LunarDate(2018, 4, 3), LunarDate(2018, 4, 4)])
+        ['2018-4-3', '2018-4-4']
+        """
+        return [self.format(obj if isinstance(obj, LunarDate) else obj.lunar) for obj in objs]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def get(fmt: str) -> 'Formatter':
+        """Return a shared compiled Formatter object for the format string."""
+        return Formatter(fmt)
 
     def resolve(self, obj, field):
         try:
@@ -0,0 +1,92 @@
+"""Vectorized solar <-> lunar conversion based on NumPy.
+
+This module requires numpy, which is not a dependency of borax, install it first.
+
+    pip install numpy
+
+>>> import numpy as np
+>>> from borax.calendars.lunardate_np import solar_to_lunar_array
+>>> solar_to_lunar_array(np.array(['2020-05-23', '2020-06-21'], dtype='datetime64[D]'))
+(array([2020, 2020], dtype=int16), array([4, 5], dtype=int8), array([1, 1], dtype=int8), array([1, 0], dtype=int8))
+"""
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from borax.calendars.lunardate import (
+    MAX_OFFSET, MIN_SOLAR_DATE, MIN_LUNAR_YEAR, MAX_LUNAR_YEAR, YEAR_START_OFFSETS, InvalidLunarDateError,
+    _YEAR_MONTHS, _MONTH_START_OFFSETS
+)
+
+__all__ = ['solar_to_lunar_array', 'lunar_to_solar_array']
+
+_MIN_SOLAR_DATE64 = np.datetime64(MIN_SOLAR_DATE, 'D')
+
+
+@lru_cache(maxsize=None)
+def _offset_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return (year, month, day, leap) arrays indexed by offset."""
+    month_years, month_numbers, month_leaps, month_days = [], [], [], []
+    for year_idx, months in enumerate(_YEAR_MONTHS):
+        for month, ndays, leap in months:
+            month_years.append(MIN_LUNAR_YEAR + year_idx)
+            month_numbers.append(month)
+            month_leaps.append(leap)
+            month_days.append(ndays)
+    month_days = np.array(month_days, dtype=np.int64)
+    month_starts = np.concatenate(([0], np.cumsum(month_days)[:-1]))
+    offsets = np.arange(MAX_OFFSET + 1, dtype=np.int64)
+    years = np.repeat(np.array(month_years, dtype=np.int16), month_days)
+    months = np.repeat(np.array(month_numbers, dtype=np.int8), month_days)
+    leaps = np.repeat(np.array(month_leaps, dtype=np.int8), month_days)
+    days = (offsets - np.repeat(month_starts, month_days)).astype(np.int8) + 1
+    return years, months, days, leaps
+
+
+@lru_cache(maxsize=None)
+def _month_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Return (start_offset, ndays) arrays indexed by [year - 1900, month, leap], ndays is 0 for invalid months."""
+    shape = (MAX_LUNAR_YEAR - MIN_LUNAR_YEAR + 1, 13, 2)
+    start_offsets = np.zeros(shape, dtype=np.int64)
+    month_ndays = np.zeros(shape, dtype=np.int64)
+    for year_idx, (months, starts) in enumerate(zip(_YEAR_MONTHS, _MONTH_START_OFFSETS)):
+        for (month, ndays, leap), start in zip(months, starts):
+            start_offsets[year_idx, month, leap] = YEAR_START_OFFSETS[year_idx] + start
+            month_ndays[year_idx, month, leap] = ndays
+    return start_offsets, month_ndays
+
+
+def solar_to_lunar_array(dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert solar dates to lunar dates in a vectorized way.
+
+    :param dates: a array-like object which can be cast to datetime64[D]
+    :return: a tuple of (year, month, day, leap) arrays with the same shape as dates
+    """
+    offsets = (np.asarray(dates, dtype='datetime64[D]') - _MIN_SOLAR_DATE64).astype(np.int64)
+    if offsets.size and (offsets.min() < 0 or offsets.max() > MAX_OFFSET):
+        raise InvalidLunarDateError('Solar date must be in the range [1900-01-31, 2101-01-28]')
+    return tuple(table[offsets] for table in _offset_tables())
+
+
+def lunar_to_solar_array(year, month, day, leap=0) -> np.ndarray:
+    """Convert lunar dates to solar dates in a vectorized way.The arguments are broadcast together.
+
+    :return: a datetime64[D] array
+    """
+    year, month, day, leap = np.broadcast_arrays(*(np.asarray(v, dtype=np.int64) for v in (year, month, day, leap)))
+    if year.size == 0:
+        return np.empty(year.shape, dtype='datetime64[D]')
+    if year.min() < MIN_LUNAR_YEAR or year.max() > MAX_LUNAR_YEAR:
+        raise InvalidLunarDateError('Year must be in the range [1900, 2100]')
+    if month.min() < 1 or month.max() > 12 or leap.min() < 0 or leap.max() > 1:
+        raise InvalidLunarDateError('Invalid month.')
+    start_offsets, month_ndays = _month_tables()
+    year_idx = year - MIN_LUNAR_YEAR
+    ndays = month_ndays[year_idx, month, leap]
+    if np.any(ndays == 0):
+        raise InvalidLunarDateError('Invalid month.')
+    if np.any((day < 1) | (day > ndays)):
+        raise InvalidLunarDateError('Invalid day')
+    offsets = start_offsets[year_idx, month, leap] + day - 1
+    return _MIN_SOLAR_DATE64 + offsets.astype('timedelta64[D]')
@@ -85,7 +85,7 @@ class CalendarFrame(ttk.Frame):
         month = self._v_month.get()
         cell_index = 0
         _mi, _ma, _left_zero = -1, -1, 0
-        for day, text, _ in self._library.iter_month_daytuples(year, month):
+        for day, text, _ in self._library.iter_month_daytuples(year, month, self._firstweekday):
             if day == 0:
                 day_text = ''
                 _left_zero += int(_mi == -1)
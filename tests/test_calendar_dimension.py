@@ -0,0 +1,38 @@
+import io
+import unittest
+from datetime import date
+
+from borax.calendars.dimension import DIMENSION_FIELDS, iter_dimension_rows, dimension_columns, dimension_to_csv
+from borax.calendars.festivals2 import FestivalLibrary, WrappedDate
+from borax.calendars.lunardate import LunarDate, MAX_OFFSET
+
+
+class DimensionTestCase(unittest.TestCase):
+    def test_rows(self):
+        library = FestivalLibrary.load_builtin()
+        for row in iter_dimension_rows(date(2024, 1, 1), date(2024, 3, 1), library):
+            ld = LunarDate.from_solar(row[0])
+            with self.subTest(solar=row[0]):
+                expected = (ld.to_solar_date(), ld.year, ld.month, ld.day, ld.leap, ld.gz_year, ld.gz_month,
+                            ld.gz_day, ld.term, ld.animal, ld.weekday(), tuple(library.get_festival_names(ld)))
+                self.assertEqual(expected, row)
+
+    def test_wrapped_date_range(self):
+        wd = WrappedDate(date(2024, 2, 10))
+        rows = list(iter_dimension_rows(wd, wd))
+        self.assertEqual(1, len(rows))
+        self.assertEqual((date(2024, 2, 10), 2024, 1, 1, 0), rows[0][:5])
+
+    def test_columns(self):
+        columns = dimension_columns()
+        self.assertEqual(set(DIMENSION_FIELDS), set(columns.keys()))
+        self.assertEqual(MAX_OFFSET + 1, len(columns['solar']))
+        self.assertEqual(LunarDate.max.to_solar_date(), columns['solar'][-1])
+
+    def test_csv(self):
+        library = FestivalLibrary.load_builtin()
+        buf = io.StringIO()
+        dimension_to_csv(buf, LunarDate(2024, 1, 1), LunarDate(2024, 1, 1), library)
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(','.join(DIMENSION_FIELDS), lines[0])
+        self.assertEqual('2024-02-10,2024,1,1,0,甲辰,丙寅,甲辰,,龙,5,春节', lines[1])
@@ -0,0 +1,35 @@
+import io
+import unittest
+from datetime import date, timedelta
+
+from borax.calendars.export import EXPORT_FIELDS, iter_calendar_rows, export_calendar_csv
+from borax.calendars.festivals2 import FestivalLibrary
+
+
+class CalendarExportTestCase(unittest.TestCase):
+    def test_rows(self):
+        library = FestivalLibrary.load_builtin()
+        rows = list(iter_calendar_rows(2023, 2024, library, max_workers=1))
+        self.assertEqual(365 + 366, len(rows))
+        self.assertEqual(date(2023, 1, 1), rows[0][0])
+        self.assertTrue(all(b[0] - a[0] == timedelta(days=1) for a, b in zip(rows, rows[1:])))
+        row = rows[365 + 40]
+        self.assertEqual((date(2024, 2, 10), '二〇二四年正月初一', '春节', ('春节',)), row)
+
+    def test_process_pool(self):
+        library = FestivalLibrary.load_builtin()
+        rows = list(iter_calendar_rows(1900, 1905, library, max_workers=1))
+        self.assertEqual(date(1900, 2, 1), rows[0][0])
+        self.assertListEqual(rows, list(iter_calendar_rows(1900, 1905, library, max_workers=2)))
+
+        rows_iter = iter_calendar_rows(1901, 2100, library, max_workers=2)
+        self.assertEqual(date(1901, 1, 1), next(rows_iter)[0])
+        rows_iter.close()
+
+    def test_csv(self):
+        buf = io.StringIO()
+        export_calendar_csv(buf, 2024, 2024, FestivalLibrary.load_builtin(), max_workers=1)
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(','.join(EXPORT_FIELDS), lines[0])
+        self.assertEqual('2024-01-01,二〇二三年冬月二十,元旦,元旦', lines[1])
+        self.assertEqual(367, len(lines))
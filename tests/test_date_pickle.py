@@ -4,7 +4,7 @@ from io import BytesIO
 
 from datetime import date
 
-from borax.calendars.lunardate import LunarDate
+from borax.calendars.lunardate import LunarDate, InvalidLunarDateError
 from borax.calendars.festivals2 import WrappedDate
 
 
@@ -16,6 +16,24 @@ class WrappedDateBasicTestCase(unittest.TestCase):
         with self.assertRaises(AttributeError):
             wd.lunar = LunarDate(2024, 1, 1)
 
+    def test_lazy_convert(self):
+        wd = WrappedDate(date(2024, 2, 10))
+        self.assertIsNone(wd._lunar)
+        self.assertEqual(LunarDate(2024, 1, 1), wd.lunar)
+        wd2 = WrappedDate(LunarDate(2024, 1, 1))
+        self.assertIsNone(wd2._solar)
+        self.assertEqual(wd, wd2)
+        wd3 = WrappedDate(wd2, name='春节')
+        self.assertEqual(date(2024, 2, 10), wd3.solar)
+        self.assertEqual(LunarDate(2024, 1, 1), wd3.lunar)
+        self.assertEqual('l', wd3._fl)
+
+        with self.assertRaises(InvalidLunarDateError):
+            WrappedDate(date(1900, 1, 30))
+        with self.assertRaises(InvalidLunarDateError):
+            WrappedDate(date(2101, 1, 29))
+        self.assertEqual(LunarDate.max, WrappedDate(date(2101, 1, 28)).lunar)
+
 
 class DatePickleTestCase(unittest.TestCase):
 
@@ -28,9 +46,11 @@ class DatePickleTestCase(unittest.TestCase):
         fp.seek(0)
         e_ld = pickle.load(fp)
         self.assertEqual(ld1, e_ld)
+        self.assertEqual(ld1.to_solar_date(), e_ld.to_solar_date())
+        self.assertEqual(ld1.gz_str(), e_ld.gz_str())
 
     def test_wrapped_date_pickle(self):
-        wd_list = [WrappedDate(date.today()), WrappedDate(LunarDate.today())]
+        wd_list = [WrappedDate(date.today()), WrappedDate(LunarDate.today()), WrappedDate(LunarDate(2024, 1, 1))]
         for wd in wd_list:
             with self.subTest(wd=wd):
                 fp = BytesIO()
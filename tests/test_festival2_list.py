@@ -1,9 +1,10 @@
 import calendar
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
 from borax.calendars.festivals2 import SolarFestival, LunarFestival, WeekFestival, TermFestival, FestivalError, \
-    FreqConst, Period, WrappedDate
+    FreqConst, Period, WrappedDate, Festival, decode_festival
 from borax.calendars.lunardate import LunarDate, LCalendars
 
 
@@ -164,6 +165,48 @@ class SpecialFeaturesTestCase(unittest.TestCase):
         self.assertIsNotNone(day30_festival.at(year=2029))
 
 
+class ResolveCacheTestCase(unittest.TestCase):
+    def tearDown(self):
+        Festival.enable_cache(0)
+
+    def test_cache(self):
+        lf = LunarFestival(month=1, day=1)
+        expected = lf.list_days(*Period.solar_year(2020, 2030))
+        Festival.enable_cache(maxsize=8)
+        self.assertListEqual(expected, lf.list_days(*Period.solar_year(2020, 2030)))
+        self.assertEqual(8, len(Festival._resolve_cache))
+        self.assertListEqual(expected, lf.list_days(*Period.solar_year(2020, 2030)))
+        self.assertEqual(date(2024, 2, 10), lf.at(2024).to_solar_date())
+        self.assertTrue(lf.is_(date(2024, 2, 10)))
+
+        lf2 = LunarFestival(freq=FreqConst.MONTHLY, day=-1)
+        lf3 = LunarFestival(freq=FreqConst.MONTHLY, day=-1, leap=0)
+        self.assertEqual(lf2.code, lf3.code)
+        self.assertEqual(2, len(lf2.list_days(*Period.lunar_month(2020, 4))))
+        self.assertEqual(1, len(lf3.list_days(*Period.lunar_month(2020, 4))))
+
+        Festival.clear_cache()
+        self.assertEqual(0, len(Festival._resolve_cache))
+        Festival.enable_cache(0)
+        self.assertIsNone(Festival._resolve_cache)
+
+    def test_threads(self):
+        Festival.enable_cache(maxsize=4)
+        lf = LunarFestival(month=8, day=15)
+        expected = [lf.at(year) for year in range(2000, 2050)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: [lf.at(year) for year in range(2000, 2050)], range(40)))
+        self.assertTrue(all(result == expected for result in results))
+        self.assertEqual(4, len(Festival._resolve_cache))
+
+    def test_out_of_year(self):
+        Festival.enable_cache()
+        lf = LunarFestival(day=384)
+        self.assertEqual(2, len(lf.list_days(*Period.lunar_year(2020, 2023))))
+        with self.assertRaises(FestivalError):
+            lf.at(2021)
+
+
 class CheckFestivalTestCase(unittest.TestCase):
     def test_all_days(self):
         ld = LunarDate(2021, 1, 3)
@@ -317,6 +360,44 @@ class FestivalListDaysTestCase(unittest.TestCase):
         self.assertIn(LunarDate(2020, 4, 30, 0), lunar_days5)
         self.assertNotIn(LunarDate(2020, 4, 29, 1), lunar_days5)
 
+    def test_missing_days(self):
+        sf = SolarFestival(freq=FreqConst.MONTHLY, day=31)
+        days = list(sf.list_days(start_date=date(2024, 1, 1), end_date=date(2024, 5, 1)))
+        self.assertListEqual([date(2024, 1, 31), date(2024, 3, 31)], [d.solar for d in days])
+        days = list(sf.list_days(start_date=date(2024, 1, 1), end_date=date(2024, 5, 1), reverse=True))
+        self.assertListEqual([date(2024, 3, 31), date(2024, 1, 31)], [d.solar for d in days])
+
+        sf2 = SolarFestival(month=2, day=29)
+        days = list(sf2.list_days(start_date=date(2020, 1, 1), end_date=date(2025, 1, 1)))
+        self.assertListEqual([date(2020, 2, 29), date(2024, 2, 29)], [d.solar for d in days])
+
+        sf3 = SolarFestival(day=-400)
+        self.assertEqual(0, len(sf3.list_days(start_date=date(2020, 1, 1), end_date=date(2025, 1, 1))))
+
+        wf = WeekFestival(month=0, index=5, week=calendar.SUNDAY)
+        days = list(wf.list_days(start_date=date(2024, 1, 1), end_date=date(2025, 1, 1)))
+        self.assertListEqual(
+            [date(2024, 3, 31), date(2024, 6, 30), date(2024, 9, 29), date(2024, 12, 29)],
+            [d.solar for d in days]
+        )
+
+    def test_days_match_is(self):
+        festivals = [
+            decode_festival('003014'), SolarFestival(freq=FreqConst.MONTHLY, day=-1), SolarFestival(day=60),
+            WeekFestival(month=0, index=-1, week=calendar.FRIDAY), WeekFestival(month=5, index=2, week=6)
+        ]
+        for cache_size in (0, 16):
+            Festival.enable_cache(cache_size)
+            for festival in festivals:
+                with self.subTest(festival=festival, cache_size=cache_size):
+                    days = [wd.solar for wd in festival.list_days(date(2023, 12, 15), date(2025, 1, 15))]
+                    expected = [day for day in LCalendars.iter_dates(date(2023, 12, 15), date(2025, 1, 15))
+                                if festival.is_(day.to_solar_date())]
+                    self.assertListEqual([ld.to_solar_date() for ld in expected], days)
+        self.assertListEqual([date(2024, 3, 1)], [wd.solar for wd in decode_festival('003014').list_days(
+            *Period.solar_year(2024))])
+        Festival.enable_cache(0)
+
     def test_week_out(self):
         wf = WeekFestival(month=1, index=7, week=calendar.MONDAY)
         days = list(wf.list_days(start_date=date(2020, 1, 1), end_date=date(2024, 1, 1)))
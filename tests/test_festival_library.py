@@ -1,10 +1,15 @@
+import copy
+import marshal
+import tempfile
 import unittest
 from datetime import date
-from io import StringIO
+from io import BytesIO, StringIO
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from borax.calendars.festivals2 import (LunarFestival, TermFestival, FestivalLibrary, FestivalSchema,
-                                        FestivalDatasetNotExist)
+from borax.calendars.festivals2 import (LunarFestival, SolarFestival, TermFestival, FestivalLibrary, FestivalSchema,
+                                        FestivalDatasetNotExist, WrappedDate)
+from borax.calendars.lunardate import LunarDate
 
 
 class FestivalLibraryTestCase(unittest.TestCase):
@@ -40,6 +45,26 @@ class FestivalLibraryTestCase(unittest.TestCase):
         festival_names = [items[1].name for items in fl.list_days(date(2022, 1, 1), date(2022, 12, 31))]
         self.assertIn('元旦', festival_names)
 
+    def test_list_next_days(self):
+        fl = FestivalLibrary.load_builtin()
+        items = fl.list_next_days(5, date_obj=date(2024, 1, 1))
+        self.assertEqual(5, len(items))
+        self.assertEqual(['元旦', '腊八节', '除夕'], [item[2].name for item in items][:3])
+        countdown_items = fl.list_days_in_countdown(date_obj=date(2024, 1, 1))
+        self.assertEqual([item[:2] for item in countdown_items[:5]], [item[:2] for item in items])
+        self.assertEqual([], FestivalLibrary().list_next_days(5))
+
+    def test_iter_days(self):
+        fl = FestivalLibrary.load_builtin()
+        items = list(fl.iter_days(date(2022, 1, 1), date(2022, 12, 31)))
+        self.assertEqual([[day, festival] for day, festival in items], fl.list_days(date(2022, 1, 1), date(2022, 12, 31)))
+        self.assertEqual(date(2022, 1, 1), items[0][0].solar)
+        r_items = list(fl.iter_days(date(2022, 1, 1), date(2022, 12, 31), reverse=True))
+        self.assertEqual(len(items), len(r_items))
+        self.assertEqual(items[-1][0].solar, r_items[0][0].solar)
+        first_day, _ = next(fl.iter_days(date(2022, 10, 1)))
+        self.assertEqual(date(2022, 10, 1), first_day.solar)
+
     def test_builtin_libraries(self):
         fl = FestivalLibrary.load_builtin('empty')
         self.assertEqual(0, len(fl))
@@ -47,6 +72,58 @@ class FestivalLibraryTestCase(unittest.TestCase):
         self.assertEqual(55, len(fl1))
 
 
+class FestivalLibraryIndexTestCase(unittest.TestCase):
+    def test_build_index(self):
+        fl = FestivalLibrary.load_builtin('basic1')
+        fl2 = FestivalLibrary.load_builtin('basic1').build_index(date(2023, 12, 1), date(2025, 1, 31))
+        for day in [date(2024, 1, 1), date(2024, 2, 10), date(2024, 4, 4), date(2024, 5, 12), date(2024, 12, 21)]:
+            with self.subTest(day=day):
+                self.assertEqual(fl.get_festival_names(day), fl2.get_festival_names(day))
+        self.assertEqual(['国庆节'], fl2.get_festival_names(date(2026, 10, 1)))  # Not indexed
+        wd = WrappedDate(date(2024, 2, 10))
+        fl3 = FestivalLibrary.load_builtin('basic1').build_index(wd, wd)
+        self.assertEqual(fl.get_festival_names(wd.solar), fl3.get_festival_names(wd))
+        self.assertEqual(['国庆节'], fl3.get_festival_names(date(2024, 10, 1)))  # Not indexed
+
+    def test_index_changed(self):
+        fl = FestivalLibrary.load_builtin().build_index(date(2024, 1, 1), date(2024, 12, 31))
+        self.assertEqual(['春节'], fl.get_festival_names(date(2024, 2, 10)))
+        fl.append(LunarFestival(month=1, day=1, name='新年'))
+        self.assertEqual(['春节', '新年'], fl.get_festival_names(date(2024, 2, 10)))
+        fl.filter_inplace(name='新年')
+        self.assertEqual(['新年'], fl.get_festival_names(date(2024, 2, 10)))
+        fl.clear()
+        self.assertEqual([], fl.get_festival_names(date(2024, 2, 10)))
+
+    def test_incremental_index(self):
+        days = [date(2024, 1, 1), date(2024, 2, 10), date(2024, 6, 10), date(2024, 10, 1), date(2024, 12, 21)]
+        fl = FestivalLibrary.load_builtin().build_index(date(2024, 1, 1), date(2024, 12, 31))
+        fl.get_code_set()
+        fl.extend_term_festivals()
+        fl.append(LunarFestival(month=1, day=1, name='新年'))
+        fl.pop(0)
+        fl.delete_by_indexes([1, 3, 5])
+        fl.exclude_inplace(name='国庆节')
+        self.assertIsNotNone(fl._day_index)  # Not rebuilt
+        self.assertIsNotNone(fl._code_index)
+        expected = FestivalLibrary(list(fl))
+        self.assertEqual(expected.get_code_set(), fl.get_code_set())
+        for day in days:
+            with self.subTest(day=day):
+                self.assertEqual(expected.get_festival_names(day), fl.get_festival_names(day))
+
+        fl2 = copy.copy(fl)
+        fl2.clear()
+        self.assertEqual(['春节', '新年'], fl.get_festival_names(date(2024, 2, 10)))
+
+        new_year = fl[-1]
+        fl.insert(0, new_year)  # The same object is already at the end.
+        self.assertEqual(['新年', '春节', '新年'], fl.get_festival_names(date(2024, 2, 10)))
+        fl.insert(len(fl) + 10, LunarFestival(month=1, day=1, name='元日'))
+        self.assertIsNotNone(fl._day_index)
+        self.assertEqual(['新年', '春节', '新年', '元日'], fl.get_festival_names(date(2024, 2, 10)))
+
+
 class FestivalLibraryUniqueTestCase(unittest.TestCase):
     def test_unique(self):
         fl = FestivalLibrary()
@@ -62,6 +139,89 @@ class FestivalLibraryUniqueTestCase(unittest.TestCase):
         fl.extend_unique(['205026', '89005'])
         self.assertEqual(3, len(fl))
 
+    def test_lookup(self):
+        fl = FestivalLibrary.load_builtin()
+        self.assertEqual('元旦', fl.get_festival('元旦').name)
+        self.assertIsNone(fl.get_festival('not-found'))
+        self.assertIn('001010', fl)
+        self.assertNotIn('001020', fl)
+        self.assertEqual('元旦', fl.get_festival_by_code('001010').name)
+        fl.append(LunarFestival(month=1, day=2, name='元旦'))
+        self.assertEqual(2, len(fl.get_festivals('元旦')))
+        self.assertEqual('001010', fl.get_festival('元旦').code)
+        fl.remove(fl.get_festival('元旦'))
+        self.assertEqual('101020', fl.get_festival('元旦').code)
+        self.assertNotIn('001010', fl)
+
+    def test_load_unique(self):
+        fp = StringIO()
+        FestivalLibrary.load_builtin().to_csv(fp)
+        FestivalLibrary.load_builtin().to_csv(fp)
+        fp.seek(0)
+        with patch('pathlib.Path.open', MagicMock(return_value=fp)):
+            fl = FestivalLibrary.load_file('dup.csv', unique=True)
+        self.assertEqual(33, len(fl))
+
+    def test_load_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / 'demo.csv'
+            file_path.write_text('001010,元旦,basic\n', encoding='utf8')
+            fl1 = FestivalLibrary.load_file(file_path)
+            fl2 = FestivalLibrary.load(str(file_path))
+            self.assertEqual(['元旦'], [festival.name for festival in fl2])
+            self.assertIsNot(fl1[0], fl2[0])
+            fl2[0].set_name('New Year')
+            self.assertEqual('元旦', fl1[0].name)
+            self.assertEqual('元旦', FestivalLibrary.load_file(file_path)[0].name)
+
+            file_path.write_text('001010,元旦,basic\n101010,春节,basic\n', encoding='utf8')
+            self.assertEqual(2, len(FestivalLibrary.load_file(file_path)))
+            FestivalLibrary.clear_load_cache()
+            self.assertEqual(2, len(FestivalLibrary.load_file(file_path)))
+
+    def test_compiled(self):
+        fl = FestivalLibrary.load_builtin('basic1')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / 'basic1.bin'
+            fl.save_compiled(file_path)
+            fl2 = FestivalLibrary.load_compiled(str(file_path))
+        self.assertListEqual(
+            [(festival.code, festival.name, festival.catalog, festival.schema) for festival in fl],
+            [(festival.code, festival.name, festival.catalog, festival.schema) for festival in fl2]
+        )
+        self.assertListEqual(fl.list_days(date(2024, 1, 1), date(2024, 12, 31)),
+                             fl2.list_days(date(2024, 1, 1), date(2024, 12, 31)))
+        self.assertIsInstance(fl2.get_festival('冬至'), TermFestival)
+
+        with self.assertRaises(ValueError):
+            FestivalLibrary.load_compiled(BytesIO(b'001010,New Year,basic'))
+        fp = BytesIO()
+        fl.save_compiled(fp)
+        data = fp.getvalue()
+        with self.assertRaises(ValueError):
+            FestivalLibrary.load_compiled(BytesIO(data[:4] + b'\xff\xff' + data[6:]))
+        with self.assertRaises(ValueError):
+            FestivalLibrary.load_compiled(BytesIO(data[:7] + bytes([2, 0]) + data[9:]))  # python 2.0
+        with self.assertRaises(ValueError):
+            FestivalLibrary.load_compiled(BytesIO(data[:len(data) // 2]))
+
+        header = FestivalLibrary._compiled_header()
+        for payload in [(('_schema', '_name'), ((0, (0, 'demo')),)), (('_schema',), ((0, (9,)),)), ((), ((0, ()),))]:
+            with self.subTest(payload=payload), self.assertRaises(ValueError):
+                FestivalLibrary.load_compiled(BytesIO(header + marshal.dumps(payload)))
+
+    def test_save_compiled_unsupported(self):
+        class CustomFestival(SolarFestival):
+            pass
+
+        festival = SolarFestival(month=1, day=1)
+        festival.extra = 1
+        for fl in [FestivalLibrary([CustomFestival(month=1, day=1)]), FestivalLibrary([festival])]:
+            fp = BytesIO()
+            with self.subTest(festival=fl[0]), self.assertRaises(ValueError):
+                fl.save_compiled(fp)
+            self.assertEqual(b'', fp.getvalue())
+
     def test_unique_for_basic_library(self):
         fl = FestivalLibrary.load_builtin('basic')
         total_1 = len(fl)
@@ -101,6 +261,45 @@ class FestivalLibraryCalendarTestCase(unittest.TestCase):
         self.assertTrue(isinstance(fl1, FestivalLibrary))
         self.assertTrue(len(fl) == len(fl1))
 
+    def test_month_cache(self):
+        fl = FestivalLibrary.load_builtin()
+        cells = list(fl.iter_month_daytuples(2022, 1, return_pos=True))
+        self.assertEqual(42, len(cells))
+        self.assertEqual((1, '元旦', 0, 5), cells[5][:2] + cells[5][3:])
+        self.assertEqual('小寒', cells[9][1])
+        self.assertEqual('除夕', cells[35][1])
+        self.assertEqual(LunarDate(2021, 12, 29), cells[35][2].lunar)
+        cells[35][2].name = 'changed'
+        wd = fl.monthdaycalendar(2022, 1)[5][0][2]
+        self.assertIsNot(cells[35][2], wd)
+        self.assertEqual(('', LunarDate(2021, 12, 29)), (wd.name, wd.lunar))
+
+        for month in range(1, 13):
+            fl.monthdaycalendar(2020, month)
+            fl.monthdaycalendar(2021, month, firstweekday=6)
+        fl.monthdaycalendar(2020, 1)
+        self.assertEqual(FestivalLibrary.MONTH_CACHE_SIZE, len(fl._month_cache))
+        self.assertEqual((2020, 1, 0), next(reversed(fl._month_cache)))
+
+        sunday_first = fl.monthdaycalendar(2022, 1, firstweekday=6)
+        self.assertEqual((1, '元旦'), sunday_first[0][6][:2])
+
+        fl.append(SolarFestival(month=1, day=3, name='测试节'))
+        self.assertEqual('测试节', fl.monthdaycalendar(2022, 1)[1][0][1])
+        fl.pop()
+        self.assertEqual('十二月', fl.monthdaycalendar(2022, 1)[1][0][1])
+
+    def test_yeardaycalendar(self):
+        fl = FestivalLibrary.load_builtin()
+        months = fl.yeardaycalendar(2022)
+        self.assertEqual(12, len(months))
+        self.assertEqual((1, '元旦'), months[0][0][5][:2])
+        self.assertEqual((1, '春节'), months[1][0][1][:2])
+        for month, days in enumerate(months, start=1):
+            with self.subTest(month=month):
+                self.assertListEqual(FestivalLibrary(fl).monthdaycalendar(2022, month), days)
+        self.assertEqual(0, len(fl._month_cache))
+
 
 class FestivalLibraryCURDTestCase(unittest.TestCase):
 
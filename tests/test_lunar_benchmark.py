@@ -3,7 +3,8 @@ import unittest
 from borax.calendars.lunardate import (
     LunarDate, MAX_OFFSET,
     YEAR_DAYS, MIN_SOLAR_DATE,
-    MAX_SOLAR_DATE
+    MAX_SOLAR_DATE, InvalidLunarDateError,
+    offset2ymdl, ymdl2offset
 )
 
 
@@ -21,3 +22,18 @@ class BenchmarkTestCase(unittest.TestCase):
         self.assertEqual('庚申年戊子月丁未日', sd2100_ld.gz_str())
         sd2101_ld = LunarDate.from_solar_date(2101, 1, 28)
         self.assertEqual('庚申年己丑月乙亥日', sd2101_ld.gz_str())
+
+    def test_offset_index(self):
+        pre = offset2ymdl(0)
+        self.assertEqual((1900, 1, 1, 0), pre)
+        for offset in range(1, MAX_OFFSET + 1):
+            ymdl = offset2ymdl(offset)
+            self.assertEqual(offset, ymdl2offset(*ymdl))
+            if ymdl[2] != 1:
+                self.assertEqual(pre[:2] + (pre[2] + 1,) + pre[3:], ymdl)
+            pre = ymdl
+        self.assertEqual((2100, 12, 29, 0), pre)
+        with self.assertRaises(InvalidLunarDateError):
+            offset2ymdl(-1)
+        with self.assertRaises(InvalidLunarDateError):
+            offset2ymdl(MAX_OFFSET + 1)
@@ -3,8 +3,9 @@ import unittest
 from datetime import date, timedelta
 
 from borax.calendars.lunardate import (
-    LunarDate, parse_year_days, LCalendars, InvalidLunarDateError, TextUtils, TermUtils
+    LunarDate, parse_year_days, LCalendars, InvalidLunarDateError, TextUtils, TermUtils, Formatter
 )
+from borax.calendars.festivals2 import WrappedDate
 
 
 class TextUtilsTestCase(unittest.TestCase):
@@ -21,6 +22,10 @@ class TextUtilsTestCase(unittest.TestCase):
             with self.subTest(value=value, text=text):
                 self.assertEqual(text, TextUtils.day_cn(value))
 
+    def test_cn_year_text(self):
+        self.assertEqual('二〇一八', TextUtils.year_cn(2018))
+        self.assertEqual('一八九九', TextUtils.year_cn(1899))  # Out of the precomputed table
+
 
 class LunarDateTestCase(unittest.TestCase):
     def test_create_date(self):
@@ -37,6 +42,20 @@ class LunarDateTestCase(unittest.TestCase):
         self.assertEqual(5, LCalendars.delta(today.after(5), today))
         self.assertEqual(-5, LCalendars.delta(today.before(5), today))
 
+    def test_from_offset(self):
+        ld = LunarDate(2017, 5, 28)
+        sd = ld.to_solar_date()
+        for i in range(60):
+            with self.subTest(i=i):
+                expected = LunarDate.from_solar(sd + timedelta(days=i))
+                self.assertEqual(expected, ld.after(i))
+                self.assertEqual(expected.gz_str(), (ld + timedelta(days=i)).gz_str())
+                self.assertEqual(expected.offset, LunarDate._from_offset(expected.offset).offset)
+        with self.assertRaises(InvalidLunarDateError):
+            LunarDate.min.before()
+        with self.assertRaises(InvalidLunarDateError):
+            LunarDate.max + timedelta(days=1)
+
     def test_last_day(self):
         self.assertEqual(LunarDate(2023, 12, 30), LunarDate.last_day(2023))
         self.assertEqual(LunarDate(2023, 1, 29), LunarDate.last_day(2023, 1))
@@ -117,10 +136,24 @@ class LunarDateTestCase(unittest.TestCase):
         self.assertEqual(1, len(dic))
         self.assertEqual('day2', dic.get(ld1))
 
+    def test_slots_and_intern(self):
+        ld = LunarDate(2018, 6, 1)
+        self.assertFalse(hasattr(ld, '__dict__'))
+        self.assertIsNot(LunarDate.from_solar_date(2018, 7, 13), LunarDate.from_solar_date(2018, 7, 13))
+        LunarDate.enable_intern()
+        try:
+            ld1 = LunarDate.from_solar_date(2018, 7, 13)
+            self.assertIs(ld1, LunarDate.from_solar_date(2018, 7, 13))
+            self.assertEqual(ld, ld1)
+        finally:
+            LunarDate.enable_intern(False)
+        self.assertIsNone(LunarDate._interned)
+
     def test_term_ganzhi_feature(self):
         ld = LunarDate(2018, 6, 26)
         self.assertEqual(datetime.date(2018, 8, 7), ld.to_solar_date())
         self.assertEqual(43287, ld._offset)
+        self.assertIsNone(ld._gz_info)  # Lazy computation
         self.assertEqual('立秋', ld.term)
         self.assertEqual('戊戌', ld.gz_year)
         self.assertEqual('庚申', ld.gz_month)
@@ -154,6 +187,9 @@ class LunarDateTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             LCalendars.create_solar_date(2101, 2)
 
+        self.assertEqual([5, 20], TermUtils.parse_term_days(2101))
+        self.assertEqual(24, len(TermUtils.parse_term_days(2100)))
+
     def test_day_start_from_term(self):
         day = TermUtils.day_start_from_term(2022, '芒种', 1, '甲')
         self.assertEqual(date(2022, 6, 10), day)
@@ -198,6 +234,19 @@ class FormatterTestCase(unittest.TestCase):
         self.assertEqual('201706031', ld3.strftime('%y%A%B%l'))
         self.assertEqual('201706031', ld3.__format__('%y%A%B%l'))
 
+    def test_cached_formatter(self):
+        self.assertIs(Formatter.get('%C'), Formatter.get('%C'))
+        ld = LunarDate(2018, 4, 3)
+        self.assertEqual('{2018}', ld.strftime('{%y}'))
+        self.assertEqual(ld.cn_str(), Formatter.get('%C').format(ld))
+
+    def test_format_many(self):
+        from borax.calendars.festivals2 import WrappedDate
+        ld = LunarDate(2017, 6, 1, 1)
+        days = [ld, ld.after(1), WrappedDate(ld.after(2))]
+        self.assertEqual(['闰六月', '初二', '初三'], Formatter('%F').format_many(days))
+        self.assertEqual([], Formatter('%F').format_many([]))
+
     def test_term(self):
         ld = LunarDate(2020, 3, 23)
         self.assertEqual('tem:-', ld.strftime('tem:%t'))
@@ -225,6 +274,15 @@ class LCalendarTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             LCalendars.ndays(2017, 13)
 
+    def test_year_month_layout(self):
+        layout = LCalendars.year_month_layout(2017)
+        self.assertEqual(13, len(layout))
+        self.assertEqual((6, 30, 1, LunarDate(2017, 6, 1, 1).offset), layout[6])
+        self.assertEqual([t[:3] for t in layout], list(LCalendars.iter_year_month(2017)))
+        self.assertEqual(LCalendars.ndays(2017), sum(t[1] for t in layout))
+        with self.assertRaises(InvalidLunarDateError):
+            LCalendars.year_month_layout(2101)
+
     def test_leap_check(self):
         self.assertTrue(LCalendars.leap_month(2017) == 6)
         self.assertFalse(LCalendars.leap_month(2017) == 7)
@@ -232,6 +290,23 @@ class LCalendarTestCase(unittest.TestCase):
         self.assertIn(2017, LCalendars.get_leap_years())
         self.assertEqual(0, len(LCalendars.get_leap_years(14)))
 
+    def test_iter_dates(self):
+        days = list(LCalendars.iter_dates(LunarDate(2020, 4, 29), LunarDate(2020, 4, 2, 1)))
+        self.assertEqual([LunarDate(2020, 4, 29), LunarDate(2020, 4, 30), LunarDate(2020, 4, 1, 1),
+                          LunarDate(2020, 4, 2, 1)], days)
+        r_days = list(LCalendars.iter_dates(date(2019, 12, 20), date(2020, 2, 10), step=7, reverse=True))
+        self.assertEqual(LunarDate.from_solar_date(2020, 2, 10), r_days[0])
+        self.assertEqual(LunarDate.from_solar_date(2020, 2, 10) - timedelta(days=49), r_days[-1])
+        self.assertEqual(8, len(r_days))
+        wd_list = list(LCalendars.iter_dates(date(2020, 1, 1), date(2020, 1, 2), wrapped=True))
+        self.assertEqual([date(2020, 1, 1), date(2020, 1, 2)], [wd.solar for wd in wd_list])
+        wd = WrappedDate(date(2024, 2, 10))
+        self.assertEqual([LunarDate(2024, 1, 1)], list(LCalendars.iter_dates(wd, wd)))
+        self.assertEqual(LunarDate.max, list(LCalendars.iter_dates(LunarDate(2100, 12, 28)))[-1])
+        self.assertEqual([], list(LCalendars.iter_dates(date(2020, 1, 2), date(2020, 1, 1))))
+        with self.assertRaises(ValueError):
+            list(LCalendars.iter_dates(step=0))
+
     def test_delta(self):
         sd = date(2018, 12, 1)
 
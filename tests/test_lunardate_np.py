@@ -0,0 +1,40 @@
+import unittest
+from datetime import date, timedelta
+
+from borax.calendars.lunardate import LunarDate, MIN_SOLAR_DATE, MAX_OFFSET, InvalidLunarDateError
+
+try:
+    import numpy as np
+    from borax.calendars.lunardate_np import solar_to_lunar_array, lunar_to_solar_array
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed.')
+class LunarArrayTestCase(unittest.TestCase):
+    def test_full_range(self):
+        dates = np.arange(np.datetime64(MIN_SOLAR_DATE), np.datetime64(MIN_SOLAR_DATE) + MAX_OFFSET + 1)
+        years, months, days, leaps = solar_to_lunar_array(dates)
+        for offset in range(0, MAX_OFFSET + 1, 97):
+            ld = LunarDate.from_solar(MIN_SOLAR_DATE + timedelta(days=offset))
+            self.assertEqual((ld.year, ld.month, ld.day, ld.leap),
+                             (years[offset], months[offset], days[offset], leaps[offset]))
+        self.assertTrue(np.array_equal(dates, lunar_to_solar_array(years, months, days, leaps)))
+
+    def test_convert(self):
+        self.assertEqual(
+            [2020, 4, 1, 1],
+            [int(a[0]) for a in solar_to_lunar_array(np.array(['2020-05-23'], dtype='datetime64[D]'))]
+        )
+        solar = lunar_to_solar_array([2020, 2018], [4, 6], [1, 26], [1, 0])
+        self.assertEqual([date(2020, 5, 23), date(2018, 8, 7)], solar.tolist())
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidLunarDateError):
+            solar_to_lunar_array(np.array(['1900-01-30'], dtype='datetime64[D]'))
+        with self.assertRaises(InvalidLunarDateError):
+            lunar_to_solar_array(2019, 1, 1, 1)
+        with self.assertRaises(InvalidLunarDateError):
+            lunar_to_solar_array(2004, 1, 30)
+        with self.assertRaises(InvalidLunarDateError):
+            lunar_to_solar_array(2101, 1, 1)